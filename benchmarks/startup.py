@@ -0,0 +1,68 @@
+""" benchmark of CLI startup time, based on python -X importtime """
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import click
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_importtime(module: str) -> dict:
+    """ function to import module in fresh interpreter
+        returns cumulative import time (in us) of every imported module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure_wall_time(args: list) -> float:
+    """ function to measure wall time (in s) of running python with given args """
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, check=True)
+    return time.perf_counter() - start_time
+
+
+@click.command()
+@click.option("--module", default="manual", help="Module to import")
+@click.option("--repeat", default=10, help="Number of measurements")
+@click.option("--top", default=15, help="Number of the slowest imports to show")
+def main(module, repeat, top):
+    """ command to report import time of module and wall time of CLI startup """
+    runs = [measure_importtime(module) for _ in range(repeat)]
+    totals = [run[module] / 1000 for run in runs]
+
+    click.echo(f"python -X importtime -c 'import {module}' ({repeat} runs)")
+    click.echo(f"  median {statistics.median(totals):.1f} ms, min {min(totals):.1f} ms")
+    click.echo(f"Slowest imports (cumulative, median of {repeat} runs):")
+
+    names = set.intersection(*[set(run) for run in runs])
+    medians = {name: statistics.median(run[name] for run in runs) / 1000 for name in names}
+    for name, value in sorted(medians.items(), key=lambda item: -item[1])[:top]:
+        click.echo(f"  {value:8.1f} ms  {name}")
+
+    wall_times = [measure_wall_time(["manual.py", "--help"]) for _ in range(repeat)]
+    baseline = [measure_wall_time(["-c", "pass"]) for _ in range(repeat)]
+    click.echo(
+        f"python manual.py --help: median {statistics.median(wall_times) * 1000:.1f} ms "
+        f"(bare interpreter {statistics.median(baseline) * 1000:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
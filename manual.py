@@ -1,9 +1,10 @@
 """ module to run some of the features from cli """
+import json
 import os
 
 import click
 
-from sum_of_subset_problem.utilities import generate_problem_with_solution
+from sum_of_subset_problem.utilities import DISTRIBUTIONS, generate_problem_with_solution
 from sum_of_subset_problem.problem import (
     SumOfSubsetExperiment,
     SumOfSubsetProblem,
@@ -49,7 +50,7 @@ def random(method, size_set, size_subset, to_file, verbose):
 )
 @click.option(
     "--path",
-    help="Path to JSON file with problem",
+    help="Path to JSON (or binary .sosp) file with problem",
     prompt="Path to JSON file with problem",
     required=True,
 )
@@ -58,8 +59,11 @@ def random(method, size_set, size_subset, to_file, verbose):
 )
 @click.option("--verbose", default=False, help="Verbose mode", prompt="Verbose mode")
 def from_file(method, path, to_file, verbose):
-    """ command to solve problem/problems imported from json file """
-    problem = SumOfSubsetProblem.from_json(path)
+    """ command to solve problem/problems imported from json (or binary .sosp) file """
+    if path.endswith(".sosp"):
+        problem = SumOfSubsetProblem.from_binary(path)
+    else:
+        problem = SumOfSubsetProblem.from_json(path)
 
     if isinstance(problem, list):
         for idx, single_problem in enumerate(problem):
@@ -82,9 +86,23 @@ def from_file(method, path, to_file, verbose):
 @click.option(
     "--to_file", default=False, help="Path to output HTML report", prompt="Path to output HTML report",
 )
-def run_experiment(path, to_file):
+@click.option(
+    "--store",
+    default=None,
+    type=str,
+    help="Path to SQLite database with results (finished runs are resumed)",
+)
+def run_experiment(path, to_file, store):
     """ command to run experiment from json file """
     experiment = SumOfSubsetExperiment.from_json(path)
+
+    if store:
+        from sum_of_subset_problem.store import (  # pylint: disable=import-outside-toplevel
+            ResultStore,
+        )
+
+        experiment.store = ResultStore(store)
+
     experiment.run()
 
     if to_file:
@@ -120,5 +138,164 @@ def run_random_experiment(size, size_set, size_subset, to_file, report):
     if report:
         experiment.build_html_report(report)
 
+
+@cli.command()
+@click.option(
+    "--path", help="Path to JSON or binary (.sosp) problem file", prompt="Path to problem file",
+)
+@click.option(
+    "--to_file",
+    help="Path to output file (binary for JSON input, JSON for binary input)",
+    prompt="Path to output file",
+)
+def convert(path, to_file):
+    """ command to convert problem file between JSON and binary (.sosp) format """
+    from sum_of_subset_problem.binary import (  # pylint: disable=import-outside-toplevel
+        binary_to_json,
+        json_to_binary,
+    )
+
+    if path.endswith(".sosp"):
+        binary_to_json(path, to_file)
+    else:
+        json_to_binary(path, to_file)
+
+
+@cli.command()
+@click.option(
+    "--count",
+    default=1000,
+    type=click.IntRange(min=0),
+    help="Number of problems",
+    prompt="Number of problems",
+)
+@click.option("--size_set", default=10, help="Size of set", prompt="Size of set")
+@click.option(
+    "--size_subset",
+    default=0,
+    help="Size of planted subset (0 means random)",
+    prompt="Size of planted subset (0 means random)",
+)
+@click.option(
+    "--distribution",
+    default="uniform",
+    type=click.Choice(DISTRIBUTIONS),
+    help="Distribution of problems",
+    prompt="Distribution of problems",
+)
+@click.option(
+    "--max_value",
+    default=10000,
+    type=click.IntRange(min=1),
+    help="Max absolute value in set",
+    prompt="Max value",
+)
+@click.option("--seed", default=0, help="Seed of random generator", prompt="Seed")
+@click.option(
+    "--to_file",
+    help="Path to output file (.jsonl or binary .sosc)",
+    prompt="Path to output file (.jsonl or binary .sosc)",
+)
+def generate(count, size_set, size_subset, distribution, max_value, seed, to_file):
+    """ command to generate corpus of problems with planted solutions """
+    from sum_of_subset_problem.generator import (  # pylint: disable=import-outside-toplevel
+        generate_corpus,
+        write_binary_corpus,
+        write_jsonl,
+    )
+
+    batches = generate_corpus(count, size_set, distribution, size_subset or None, max_value, seed)
+
+    if to_file.endswith(".sosc"):
+        write_binary_corpus(batches, to_file, size_set)
+    else:
+        write_jsonl(batches, to_file)
+
+
+@cli.command()
+@click.option("--socket", help="Path to Unix socket", prompt="Path to Unix socket")
+@click.option("--workers", default=0, help="Number of worker processes (0 means all CPUs)")
+@click.option("--batch_size", default=32, help="Max number of requests in single batch")
+@click.option("--max_pending", default=1024, help="Max number of requests waiting for workers")
+def serve(socket, workers, batch_size, max_pending):
+    """ command to run solve service on Unix socket """
+    from sum_of_subset_problem.service import run_service  # pylint: disable=import-outside-toplevel
+
+    run_service(socket, workers=workers or None, batch_size=batch_size, max_pending=max_pending)
+
+
+@cli.command()
+@click.option("--path", help="Path to experiment", prompt="Path to experiment")
+@click.option("--queue", help="Path to shared queue directory", prompt="Path to queue directory")
+@click.option("--lease", default=600, help="Lease of single task (in s)")
+@click.option("--to_file", default=None, type=str, help="Path to output HTML report")
+def run_distributed_experiment(path, queue, lease, to_file):
+    """ command to queue experiment from json file and wait for workers to solve it """
+    experiment = SumOfSubsetExperiment.from_json(path)
+    failed = experiment.run_distributed(queue, lease=lease)
+
+    if to_file:
+        experiment.build_html_report(to_file)
+
+    for item in failed:
+        click.echo(
+            f"FAILED solver {item['solver_id']} on problem {item['problem_idx']}: {item['error']}"
+        )
+
+    if failed:
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.option("--queue", help="Path to shared queue directory", prompt="Path to queue directory")
+@click.option("--lease", default=600, help="Lease of single task (in s)")
+def worker(queue, lease):
+    """ command to solve tasks from queue directory until experiment is finished """
+    from sum_of_subset_problem.work_queue import (  # pylint: disable=import-outside-toplevel
+        run_worker,
+    )
+
+    run_worker(queue, SumOfSubsetExperiment, lease=lease)
+
+
+@cli.command()
+@click.argument("paths", nargs=-1, required=True)
+@click.option(
+    "--problem", default=None, help="Path to JSON file with problems (for solutions only files)",
+)
+@click.option("--workers", default=0, help="Number of worker processes (0 means all CPUs)")
+def verify(paths, problem, workers):
+    """ command to verify solutions from JSON/JSONL files """
+    from sum_of_subset_problem.verify import (  # pylint: disable=import-outside-toplevel
+        verify_files,
+    )
+
+    problems = None
+    if problem:
+        with open(problem) as input_file:
+            problems = json.load(input_file)
+
+    summaries, time_taken = verify_files(list(paths), problems, workers or None)
+
+    checked = sum(summary["checked"] for summary in summaries)
+    failures = sum(summary["failures"] for summary in summaries)
+    unsolved = sum(summary["unsolved"] for summary in summaries)
+
+    for summary in summaries:
+        for example in summary["examples"]:
+            click.echo(f"FAILED {summary['file']} (item {example['item']}): {example['reason']}")
+        if summary["failures"] > len(summary["examples"]):
+            click.echo(f"... {summary['failures']} failures in {summary['file']}")
+
+    click.echo(
+        f"Checked {checked} solutions from {len(summaries)} files in {time_taken:.3f} s "
+        f"({checked / max(time_taken, 1e-9):.0f} solutions/s): "
+        f"{checked - failures - unsolved} correct, {unsolved} unsolved, {failures} failed"
+    )
+
+    if failures:
+        raise SystemExit(1)
+
+
 if __name__ == "__main__":
     cli()
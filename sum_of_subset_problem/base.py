@@ -1,14 +1,19 @@
 """ module with all the base classes """
 import abc
+from array import array
 from collections import UserDict
 import json
+import random
 import time
-from typing import List, Union
+from typing import TYPE_CHECKING, List, Tuple, Union
 from types import FunctionType
 import math # pylint: disable=unused-import
 
 from sum_of_subset_problem import logger
 
+if TYPE_CHECKING:
+    from sum_of_subset_problem.store import ResultStore
+
 
 class Solution(abc.ABC, UserDict):
     """ abstract class representing single solution
@@ -117,16 +122,92 @@ class Problem(abc.ABC, UserDict):
         return str(self)
 
 
+class Trajectory:
+    """ class to record convergence of solver in preallocated ring buffers
+        only every n-th iteration is recorded, when buffers are full the oldest items are replaced
+    """
+
+    DEFAULT_CAPACITY = 1000
+    DEFAULT_EVERY = 1
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, every: int = DEFAULT_EVERY):
+        if capacity <= 0 or every <= 0:
+            raise ValueError("Capacity and every must be positive numbers")
+
+        self.capacity = capacity
+        self.every = every
+        self.recorded = 0
+        self.iteration = array("q", bytes(8 * capacity))
+        self.current = array("q", bytes(8 * capacity))
+        self.best = array("q", bytes(8 * capacity))
+        self.temperature = array("d", bytes(8 * capacity))
+
+    def is_due(self, iteration: int) -> bool:
+        """ checks if given iteration should be recorded """
+        return iteration % self.every == 0
+
+    def record(self, iteration: int, current: int, best: int, temperature: float = math.nan):
+        """ method to save single point of trajectory """
+        position = self.recorded % self.capacity
+        self.iteration[position] = iteration
+        self.current[position] = current
+        self.best[position] = best
+        self.temperature[position] = temperature
+        self.recorded += 1
+
+    def __len__(self):
+        return min(self.recorded, self.capacity)
+
+    @property
+    def last_iteration(self) -> int:
+        """ returns the latest recorded iteration (or -1 if nothing is recorded) """
+        if not self.recorded:
+            return -1
+        return self.iteration[(self.recorded - 1) % self.capacity]
+
+    def _ordered(self, buffer: array) -> list:
+        """ helper method to get items of buffer from the oldest one """
+        if self.recorded <= self.capacity:
+            return buffer[: self.recorded].tolist()
+        position = self.recorded % self.capacity
+        return buffer[position:].tolist() + buffer[:position].tolist()
+
+    def to_dict(self) -> dict:
+        """ method to export trajectory (nan temperatures are exported as None) """
+        return {
+            "every": self.every,
+            "dropped": self.recorded - len(self),
+            "iteration": self._ordered(self.iteration),
+            "current": self._ordered(self.current),
+            "best": self._ordered(self.best),
+            "temperature": [
+                None if math.isnan(value) else value for value in self._ordered(self.temperature)
+            ],
+        }
+
+
 class Solver(abc.ABC):
     """ abstract class to solve problem using given algorithm
         provides solve method and helper methods
     """
 
+    RESTARTS = ("restart", "kick")
+    DEFAULT_RESTART = "restart"
+    DEFAULT_KICK_SIZE = 3
+
     def __init__(self, problem: Problem):
         self.name = self.__class__.__name__
         self.problem = problem
         self.report = {"attempts": 0, "time": 0}
         self.solutions = []
+        self.trajectory = None
+        self.time_limit = None
+        self.stagnation = None
+        self.restart = self.DEFAULT_RESTART
+        self.kick_size = self.DEFAULT_KICK_SIZE
+        self.best_solution = None
+        self.run_best_solution = None
+        self.last_improvement = 0
 
     @abc.abstractmethod
     def solve(self) -> Solution:
@@ -148,6 +229,127 @@ class Solver(abc.ABC):
             f"Found solution ({solution}) (time={self.report['time']}, attempts={self.report['attempts']})"
         )
 
+    def finish(self, solution: Solution, start_time: float, best: Solution = None) -> Solution:
+        """ update "time", log final solution and add trajectory to report
+            final point (solution and best, default: solution) is recorded whatever the decimation
+        """
+        self.log_solution(solution, start_time)
+        if self.trajectory is not None:
+            self.record_trajectory(solution, best, final=True)
+            self.report["trajectory"] = self.trajectory.to_dict()
+        return solution
+
+    def prepare_time_limit(self, **kwargs):
+        """ set "time_limit" (in s), after which solver returns its current solution """
+        self.time_limit = kwargs.get("time_limit")
+
+        if self.time_limit is not None:
+            logger.info(f"Set time_limit to {self.time_limit}")
+
+    def is_out_of_time(self, start_time: float) -> bool:
+        """ checks if time_limit is exceeded """
+        if self.time_limit is not None and time.time() - start_time >= self.time_limit:
+            logger.warning(f"Runned out of time (time_limit={self.time_limit})")
+            return True
+        return False
+
+    def prepare_restarts(self, **kwargs):
+        """ enable restarts if "stagnation" param (number of attempts without improvement)
+            is provided, "restart" sets what is done then (one of RESTARTS)
+            and "kick_size" number of random moves of "kick"
+        """
+        self.stagnation = kwargs.get("stagnation")
+        self.restart = kwargs.get("restart", self.DEFAULT_RESTART)
+        self.kick_size = kwargs.get("kick_size", self.DEFAULT_KICK_SIZE)
+
+        if self.stagnation:
+            if self.restart not in self.RESTARTS:
+                raise ValueError(
+                    f"Unknown restart {self.restart} (expected one of {self.RESTARTS})"
+                )
+
+            self.report["restarts"] = 0
+            self.report["best_attempt"] = 0
+            logger.info(f"Set stagnation to {self.stagnation} (restart={self.restart})")
+
+    def track_stagnation(self, solution: Solution) -> bool:
+        """ keep the best solution (across restarts)
+            returns True if current run has not improved within "stagnation" attempts
+        """
+        attempts = self.report["attempts"]
+
+        if self.best_solution is None or solution > self.best_solution:
+            self.best_solution = solution
+            self.report["best_attempt"] = attempts
+
+        if self.run_best_solution is None or solution > self.run_best_solution:
+            self.run_best_solution = solution
+            self.last_improvement = attempts
+            return False
+
+        return attempts - self.last_improvement >= self.stagnation
+
+    def restart_from(self, solution: Solution, **kwargs) -> Solution:
+        """ start new run after stagnation, kwargs are passed to generate_random_solution
+            "kick" makes kick_size random moves from solution,
+            other restarts (like SA reheat) keep solution
+        """
+        self.report["restarts"] += 1
+        self.run_best_solution = None
+        self.last_improvement = self.report["attempts"]
+        logger.info(f"Stagnation after {self.report['attempts']} attempts, {self.restart}")
+
+        if self.restart == "restart":
+            return self.problem.generate_random_solution(**kwargs)
+
+        if self.restart == "kick":
+            for _ in range(self.kick_size):
+                solution = self.problem.find_close_neighbor(solution)
+
+        return solution
+
+    def prepare_trajectory(self, **kwargs):
+        """ enable trajectory recording if "trajectory" param (capacity or True) is provided
+            "trajectory_every" sets decimation
+        """
+        capacity = kwargs.get("trajectory")
+        every = kwargs.get("trajectory_every", Trajectory.DEFAULT_EVERY)
+
+        if capacity:
+            if capacity is True:
+                capacity = Trajectory.DEFAULT_CAPACITY
+            self.trajectory = Trajectory(capacity, every)
+            logger.info(f"Set trajectory to {capacity} (every={every})")
+
+    def record_trajectory(
+            self,
+            current: Solution,
+            best: Solution = None,
+            temperature: FunctionType = None,
+            final: bool = False,
+    ):
+        """ save current and best (default: current) solutions to trajectory
+            temperature is function of iteration (as in SimulatedAnnealing)
+            goals are evaluated only for iterations which are recorded (or final one)
+        """
+        iteration = self.report["attempts"]
+        if self.trajectory is None:
+            return
+
+        if final:
+            if self.trajectory.last_iteration == iteration:
+                return
+        elif not self.trajectory.is_due(iteration):
+            return
+
+        best = best if best is not None else current
+        self.trajectory.record(
+            iteration,
+            current.goal(),
+            best.goal(),
+            temperature(iteration) if temperature else math.nan,
+        )
+
     def log_welcome(self):
         """ log welcome message """
         logger.info(f"Running {self.__class__.__name__}")
@@ -157,13 +359,14 @@ class Solver(abc.ABC):
 class Experiment(abc.ABC, UserDict):
     """ abstract class to solve several problems using different solvers and params """
 
-    def __init__(self, data=None):
+    def __init__(self, data=None, store: "ResultStore" = None):
         self.name = self.__class__.__name__
         super().__init__(data)
         self.data["problems"] = self.data.get("problems", [])
         self.data["solvers"] = self.data.get("solvers", [])
         self.data["report"] = {}
         self.problems = []
+        self.store = store
 
     @property
     @abc.abstractmethod
@@ -229,33 +432,165 @@ class Experiment(abc.ABC, UserDict):
                 )
             )
 
+    def _run_solver(self, problem: Problem, solver_item: dict) -> Tuple[Solver, Solution]:
+        """ method to solve single problem with single solver """
+        solver = self.problem_class.solvers.get(solver_item.get("solver_name"))(problem)
+        params = solver_item.get("params", {})
+
+        logger.info(f"Working on {problem}")
+        logger.info(f"Running {solver.__class__.__name__} with params ({params})")
+
+        if self.data.get("seed") is not None:
+            random.seed(self.data.get("seed"))
+
+        if params:
+            processed_params = params.copy()
+            for key in processed_params.keys():
+                if "lambda" in str(processed_params[key]):
+                    processed_params[key] = self._prepare_lambda_argument(processed_params[key])
+            solution = solver.solve(**processed_params)
+        else:
+            solution = solver.solve()
+
+        return solver, solution
+
+    def _resume_from_store(
+            self, idx_of_problem: int, idx_of_solver: int, problem_hash: str
+    ) -> bool:
+        """ method to add already finished run from store to report
+            returns False if there is no such run
+        """
+        solver_item = self.data["solvers"][idx_of_solver]
+        run = self.store.find_run(
+            problem_hash,
+            solver_item.get("solver_name"),
+            solver_item.get("params"),
+            self.data.get("seed"),
+        )
+        if run is None:
+            return False
+
+        logger.info(f"Found run {run['id']} in {self.store.path}, skipping")
+        self.data["report"].setdefault(idx_of_problem, []).append(
+            {
+                "solver_id": idx_of_solver,
+                "report": run["report"],
+                "solution": run["solution"],
+                "goal": run["goal"],
+            }
+        )
+        return True
+
+    def _save_to_store(
+            self, problem_hash: str, solver_item: dict, solver: Solver, solution: Solution
+    ):
+        """ method to save finished run to store """
+        self.store.add_run(
+            problem_hash,
+            solver_item.get("solver_name"),
+            solver_item.get("params"),
+            self.data.get("seed"),
+            solver.report,
+            solution.data if solution is not None else None,
+            solution.goal() if solution is not None else None,
+        )
+
     def run(self):
-        """ method to solve all the problems with solvers """
+        """ method to solve all the problems with solvers
+            if store is provided, runs already saved there are not repeated
+            and every new run is saved as soon as it is finished
+        """
         self._prepare_problems()
+        if self.store is not None:
+            # store (and sqlite3) is imported only when it is used
+            from sum_of_subset_problem.store import (  # pylint: disable=import-outside-toplevel
+                hash_problem,
+            )
+
         for idx_of_problem, problem in enumerate(self.problems):
+            problem_hash = hash_problem(problem.data) if self.store is not None else None
+
             for idx_of_solver, solver_item in enumerate(self.data["solvers"]):
-                solver = self.problem_class.solvers.get(solver_item.get("solver_name"))(problem)
-                params = solver_item.get("params", {})
-
-                logger.info(f"Working on {problem}")
-                logger.info(f"Running {solver.__class__.__name__} with params ({params})")
-
-                if params:
-                    processed_params = params.copy()
-                    for key in processed_params.keys():
-                        if "lambda" in str(processed_params[key]):
-                            processed_params[key] = self._prepare_lambda_argument(
-                                processed_params[key]
-                            )
-                    solution = solver.solve(**processed_params)
-                else:
-                    solution = solver.solve()
+                if self.store is not None and self._resume_from_store(
+                        idx_of_problem, idx_of_solver, problem_hash
+                ):
+                    continue
+
+                solver, solution = self._run_solver(problem, solver_item)
 
                 logger.info("Adding results to report")
                 self._add_to_report(idx_of_problem, idx_of_solver, solver, solution)
 
+                if self.store is not None:
+                    self._save_to_store(problem_hash, solver_item, solver, solution)
+
+        self._sort_report()
+
+        if self.store is not None:
+            logger.info(f"{self.__class__.__name__} finished, results saved in {self.store.path}")
+        else:
+            logger.info(f"{self.__class__.__name__} result:\n{json.dumps(self.data, indent=4)}")
+
+    def run_task(self, idx_of_problem: int, idx_of_solver: int) -> dict:
+        """ method to solve single problem with single solver, returns item of report """
+        if not self.problems:
+            self._prepare_problems()
+
+        solver, solution = self._run_solver(
+            self.problems[idx_of_problem], self.data["solvers"][idx_of_solver]
+        )
+        return {
+            "solver_id": idx_of_solver,
+            "report": solver.report,
+            "solution": solution.data if solution is not None else None,
+            "goal": solution.goal() if solution is not None else None,
+        }
+
+    def run_distributed(self, path: str, lease: float = None, poll: float = None) -> List[dict]:
+        """ method to queue all the tasks in directory shared with workers
+            and wait until they are solved, expired leases are re-queued
+            workers are started separately (see work_queue.run_worker)
+            returns failed tasks (problem_idx, solver_id and error), they are not in report
+        """
+        from sum_of_subset_problem.work_queue import (  # pylint: disable=import-outside-toplevel
+            DEFAULT_LEASE,
+            DEFAULT_POLL,
+            WorkQueue,
+        )
+
+        work_queue = WorkQueue(path, lease or DEFAULT_LEASE)
+        work_queue.submit(self.data)
+
+        while not work_queue.is_finished():
+            work_queue.requeue_expired()
+            time.sleep(poll or DEFAULT_POLL)
+
+        self.data["report"] = {}
+        failed = []
+        for result in work_queue.collect():
+            if "error" in result:
+                logger.error(
+                    f"Solver {result['solver_id']} failed on problem {result['problem_idx']}: "
+                    f"{result['error']}"
+                )
+                failed.append(result)
+                continue
+            self.data["report"].setdefault(result.pop("problem_idx"), []).append(result)
+
+        self._sort_report()
+        logger.info(f"{self.__class__.__name__} finished, results saved in {path}")
+        return failed
+
+    def report_from_store(self) -> dict:
+        """ method to rebuild report from runs saved in store """
+        if self.store is None:
+            raise ValueError("Experiment has no store")
+
+        self.data["report"] = self.store.build_report(
+            self.data["problems"], self.data["solvers"], self.data.get("seed")
+        )
         self._sort_report()
-        logger.info(f"{self.__class__.__name__} result:\n{json.dumps(self.data, indent=4)}")
+        return self.data["report"]
 
     @classmethod
     def from_json(cls, file_path: str) -> "Experiment":
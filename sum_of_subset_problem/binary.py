@@ -0,0 +1,148 @@
+""" module with compact binary format of SumOfSubset problems
+    file consists of header (magic, number, length of set) and raw little-endian int64 set
+    set is opened with numpy.memmap, so it is not copied into memory
+    and all the processes which open the same file share its pages
+    set is written sorted (its order does not change the problem), so mapped set
+    is its own multiset index and no process needs a sorted copy
+"""
+import json
+import os
+import struct
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from sum_of_subset_problem import logger
+
+BINARY_EXTENSION = ".sosp"
+MAGIC = b"SOSP0001"
+HEADER = struct.Struct("<8sqq")
+DTYPE = np.dtype("<i8")
+
+
+def write_binary(problem_data: dict, file_path: str):
+    """ function to write problem data ({"set": ..., "number": ...}) to binary file
+        set is sorted
+    """
+    set_of_numbers = np.sort(np.asarray(problem_data["set"], dtype=DTYPE))
+
+    with open(file_path, "wb") as output_file:
+        output_file.write(HEADER.pack(MAGIC, int(problem_data["number"]), len(set_of_numbers)))
+        output_file.write(set_of_numbers.tobytes())
+
+
+def read_header(file_path: str) -> Tuple[int, int]:
+    """ function to read header of binary file, returns number and length of set """
+    with open(file_path, "rb") as input_file:
+        header = input_file.read(HEADER.size)
+
+    if len(header) != HEADER.size:
+        raise ValueError(f"{file_path} is too short to be a problem file")
+
+    magic, number, length = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{file_path} is not a problem file")
+
+    if os.path.getsize(file_path) != HEADER.size + length * DTYPE.itemsize:
+        raise ValueError(f"{file_path} is truncated")
+
+    return number, length
+
+
+def read_binary(file_path: str) -> dict:
+    """ function to read problem data from binary file
+        set is read-only numpy.memmap
+    """
+    number, length = read_header(file_path)
+
+    if length:
+        set_of_numbers = np.memmap(
+            file_path, dtype=DTYPE, mode="r", offset=HEADER.size, shape=(length,)
+        )
+    else:
+        set_of_numbers = np.empty(0, dtype=DTYPE)
+
+    return {"set": set_of_numbers, "number": number}
+
+
+def json_to_binary(json_path: str, binary_path: str) -> List[str]:
+    """ function to convert JSON file with problem (or list of problems) to binary files
+        list of problems is written to numbered files (binary_path with _<idx> suffix)
+        returns paths of written files
+    """
+    with open(json_path) as input_file:
+        data = json.load(input_file)
+
+    if isinstance(data, dict):
+        write_binary(data, binary_path)
+        return [binary_path]
+
+    if isinstance(data, list):
+        root, extension = os.path.splitext(binary_path)
+        paths = [f"{root}_{idx}{extension or BINARY_EXTENSION}" for idx in range(len(data))]
+        for problem_data, path in zip(data, paths):
+            write_binary(problem_data, path)
+        logger.info(f"Converted {len(paths)} problems from {json_path}")
+        return paths
+
+    raise TypeError("Expected list or dict")
+
+
+def binary_to_json(binary_paths: Union[str, List[str]], json_path: str):
+    """ function to convert binary file (or list of files) to JSON file """
+    if isinstance(binary_paths, str):
+        data = read_binary(binary_paths)
+        data["set"] = data["set"].tolist()
+    else:
+        data = []
+        for path in binary_paths:
+            problem_data = read_binary(path)
+            problem_data["set"] = problem_data["set"].tolist()
+            data.append(problem_data)
+
+    with open(json_path, "w") as output_file:
+        output_file.write(json.dumps(data))
+
+
+CORPUS_EXTENSION = ".sosc"
+CORPUS_MAGIC = b"SOSC0001"
+CORPUS_HEADER = struct.Struct("<8sq")
+
+
+def corpus_dtype(length_of_set: int) -> np.dtype:
+    """ returns dtype of single corpus record
+        solution is a mask of set (all zeros for infeasible problems)
+    """
+    return np.dtype(
+        [
+            ("number", "<i8"),
+            ("set", "<i8", (length_of_set,)),
+            ("solution", "u1", (length_of_set,)),
+        ]
+    )
+
+
+def write_corpus_header(output_file, length_of_set: int):
+    """ function to write header of corpus file (all problems have the same length of set) """
+    output_file.write(CORPUS_HEADER.pack(CORPUS_MAGIC, length_of_set))
+
+
+def read_corpus(file_path: str) -> np.ndarray:
+    """ function to open corpus file as memory-mapped array of records
+        (fields: number, set, solution)
+    """
+    with open(file_path, "rb") as input_file:
+        magic, length_of_set = CORPUS_HEADER.unpack(input_file.read(CORPUS_HEADER.size))
+
+    if magic != CORPUS_MAGIC:
+        raise ValueError(f"{file_path} is not a corpus file")
+
+    dtype = corpus_dtype(length_of_set)
+    size, rest = divmod(os.path.getsize(file_path) - CORPUS_HEADER.size, dtype.itemsize)
+    if rest:
+        raise ValueError(f"{file_path} is truncated")
+
+    if not size:
+        return np.empty(0, dtype=dtype)
+
+    return np.memmap(file_path, dtype=dtype, mode="r", offset=CORPUS_HEADER.size, shape=(size,))
@@ -0,0 +1,187 @@
+""" module to generate large corpora of SumOfSubset problems with planted solutions
+    problems are generated in batches with seeded numpy RNG
+"""
+import json
+from typing import Iterator, Optional
+
+import numpy as np
+
+from sum_of_subset_problem import logger
+from sum_of_subset_problem.binary import corpus_dtype, write_corpus_header
+from sum_of_subset_problem.utilities import DISTRIBUTIONS
+DEFAULT_MAX_VALUE = 10000
+DEFAULT_BATCH_SIZE = 10000
+INT64_LIMIT = 2 ** 62
+# longest set of "hard" distribution, values up to 2 ** length keep density 1 and sums in int64
+MAX_HARD_LENGTH = max(n for n in range(1, 63) if n * 2 ** n < INT64_LIMIT)
+
+
+def _draw_sets(rng, distribution: str, shape: tuple, max_value: int) -> np.ndarray:
+    """ helper to draw sets of given distribution """
+    if distribution == "uniform":
+        return rng.integers(1, max_value, size=shape, endpoint=True)
+
+    if distribution == "hard":
+        # density (length of set / log2 of max value) equal to 1 (length is checked by caller)
+        return rng.integers(1, 2 ** shape[1], size=shape, endpoint=True)
+
+    if distribution == "negative":
+        return rng.integers(-max_value, max_value, size=shape, endpoint=True)
+
+    if distribution == "infeasible":
+        # only even numbers, so every subset sums to even number
+        return 2 * rng.integers(1, max(max_value // 2, 1), size=shape, endpoint=True)
+
+    raise ValueError(f"Unknown distribution {distribution} (expected one of {DISTRIBUTIONS})")
+
+
+def _draw_solutions(rng, shape: tuple, length_of_subset: Optional[int]) -> np.ndarray:
+    """ helper to draw masks of planted solutions
+        every row has length_of_subset (or random, but at least one) selected items
+    """
+    if length_of_subset:
+        ranks = np.argsort(rng.random(shape), axis=1)
+        return ranks < length_of_subset
+
+    solutions = rng.random(shape) < 0.5
+    empty = ~solutions.any(axis=1)
+    solutions[empty, rng.integers(0, shape[1], size=int(empty.sum()))] = True
+    return solutions
+
+
+def generate_batch(
+        rng,
+        size: int,
+        length_of_set: int,
+        distribution: str = "uniform",
+        length_of_subset: Optional[int] = None,
+        max_value: int = DEFAULT_MAX_VALUE,
+) -> np.ndarray:
+    """ function to generate batch of problems as corpus records (number, set, solution)
+        solution of infeasible problem is empty mask and its number is odd
+    """
+    shape = (size, length_of_set)
+    records = np.zeros(size, dtype=corpus_dtype(length_of_set))
+    records["set"] = _draw_sets(rng, distribution, shape, max_value)
+    solutions = _draw_solutions(rng, shape, length_of_subset)
+    numbers = np.where(solutions, records["set"], 0).sum(axis=1)
+
+    if distribution == "infeasible":
+        records["number"] = numbers + 1
+    else:
+        records["number"] = numbers
+        records["solution"] = solutions
+
+    return records
+
+
+def generate_corpus(
+        count: int,
+        length_of_set: int,
+        distribution: str = "uniform",
+        length_of_subset: Optional[int] = None,
+        max_value: int = DEFAULT_MAX_VALUE,
+        seed: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[np.ndarray]:
+    """ function to get generator of batches of corpus records
+        arguments are checked at once, before any output file is opened
+        the same seed gives the same corpus (for the same batch_size)
+        hard problems have density 1 (values up to 2 ** length of set, max_value is ignored),
+        so their sets have at most MAX_HARD_LENGTH (56) numbers
+    """
+    if count < 0:
+        raise ValueError("Count of problems cannot be negative")
+
+    if length_of_set <= 0:
+        raise ValueError("Length of set must be positive number")
+
+    if max_value < 1:
+        raise ValueError("Max value must be positive number")
+
+    if length_of_subset is not None and not 0 < length_of_subset <= length_of_set:
+        raise ValueError("Length of subset must be positive and not bigger than length of set")
+
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution} (expected one of {DISTRIBUTIONS})")
+
+    if distribution == "hard" and length_of_set > MAX_HARD_LENGTH:
+        raise ValueError(
+            f"Length of set of hard problems cannot be bigger than {MAX_HARD_LENGTH} "
+            "(values with density close to 1 would not fit in int64)"
+        )
+
+    if max_value * length_of_set >= INT64_LIMIT:
+        raise ValueError("Sum of set would not fit in int64")
+
+    return _generate_batches(
+        np.random.default_rng(seed),
+        count,
+        length_of_set,
+        distribution,
+        length_of_subset,
+        max_value,
+        batch_size,
+    )
+
+
+def _generate_batches(
+        rng,
+        count: int,
+        length_of_set: int,
+        distribution: str,
+        length_of_subset: Optional[int],
+        max_value: int,
+        batch_size: int,
+) -> Iterator[np.ndarray]:
+    """ generator of batches of corpus records (arguments are checked by generate_corpus) """
+    for start in range(0, count, batch_size):
+        yield generate_batch(
+            rng,
+            min(batch_size, count - start),
+            length_of_set,
+            distribution,
+            length_of_subset,
+            max_value,
+        )
+
+
+def records_to_dicts(records: np.ndarray) -> Iterator[dict]:
+    """ generator of problems with solutions, in the same layout as generate_problem_with_solution
+        solution of infeasible problem is None
+    """
+    sets = records["set"].tolist()
+    numbers = records["number"].tolist()
+    solutions = records["solution"].tolist()
+
+    for idx, set_of_numbers in enumerate(sets):
+        solution = [
+            number for number, selected in zip(set_of_numbers, solutions[idx]) if selected
+        ] or None
+
+        yield {"problem": {"set": set_of_numbers, "number": numbers[idx]}, "solution": solution}
+
+
+def write_jsonl(batches: Iterator[np.ndarray], file_path: str) -> int:
+    """ function to stream batches of records to JSONL file, returns number of problems """
+    count = 0
+    with open(file_path, "w") as output_file:
+        for records in batches:
+            output_file.writelines(json.dumps(item) + "\n" for item in records_to_dicts(records))
+            count += len(records)
+
+    logger.info(f"Written {count} problems to {file_path}")
+    return count
+
+
+def write_binary_corpus(batches: Iterator[np.ndarray], file_path: str, length_of_set: int) -> int:
+    """ function to stream batches of records to binary corpus file, returns number of problems """
+    count = 0
+    with open(file_path, "wb") as output_file:
+        write_corpus_header(output_file, length_of_set)
+        for records in batches:
+            output_file.write(records.tobytes())
+            count += len(records)
+
+    logger.info(f"Written {count} problems to {file_path}")
+    return count
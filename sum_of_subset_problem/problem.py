@@ -5,11 +5,9 @@ import random
 import time
 import math
 
-import jinja2
-import matplotlib.pyplot as plt
-
 from sum_of_subset_problem import logger
 from sum_of_subset_problem.base import Problem, Solution, Solver, Experiment
+from sum_of_subset_problem.verify import build_index, count_in_index, is_contained
 
 
 class SumOfSubsetSolution(Solution):
@@ -20,6 +18,7 @@ class SumOfSubsetSolution(Solution):
         self.subset = data["subset"]
         self.set = self.problem.set
         self.number = self.problem.number
+        self.cached_goal = None
 
     def __eq__(self, solution: "SumOfSubsetSolution"):
         if isinstance(solution, SumOfSubsetSolution):
@@ -28,16 +27,21 @@ class SumOfSubsetSolution(Solution):
         return False
 
     def goal(self) -> int:
-        """ returns goal function value for SumOfSubsetSolution """
-        if self.check_correctness(self.set, self.subset):
-            return abs(sum(self.subset) - self.number)
+        """ returns goal function value for SumOfSubsetSolution
+            subset does not change, so it is evaluated once (comparisons call it many times)
+        """
+        if self.cached_goal is None:
+            if self.problem.contains(self.subset):
+                self.cached_goal = abs(sum(self.subset) - self.number)
+            else:
+                self.cached_goal = -1
 
-        return -1
+        return self.cached_goal
 
     @staticmethod
     def check_correctness(set_of_numbers, subset) -> bool:
-        """ check correctness of solution """
-        return all([number in set_of_numbers for number in subset])
+        """ check correctness of solution (every number is used at most as many times as in set) """
+        return is_contained(build_index(set_of_numbers), subset)
 
 
 class BruteforceSumOfSubsetSolver(Solver):
@@ -53,25 +57,32 @@ class BruteforceSumOfSubsetSolver(Solver):
             logger.info(f"Set limit to {limit}")
 
         logger.info(f"Set verbose to {verbose} (default=False)")
+        self.prepare_time_limit(**kwargs)
 
         start_time = time.time()
 
-        for i in range(1, len(self.problem.set) + 1):
+        # memory-mapped set is turned into list, so combinations consist of python ints
+        set_of_numbers = self.problem.set
+        if hasattr(set_of_numbers, "tolist"):
+            set_of_numbers = set_of_numbers.tolist()
+
+        for i in range(1, len(set_of_numbers) + 1):
 
             # trying all the combinations from set, of size i
-            for combination in itertools.combinations(self.problem.set, i):
+            for combination in itertools.combinations(set_of_numbers, i):
                 self.add_attempt()
 
                 solution = SumOfSubsetSolution({"subset": combination,}, problem=self.problem)
 
                 if solution.is_optimal():
-                    self.log_solution(solution, start_time)
-                    return solution
+                    return self.finish(solution, start_time)
 
                 if limit and self.report["attempts"] == limit:
                     logger.warning(f"Runned out of tries (limit={limit})")
-                    self.log_solution(solution, start_time)
-                    return solution
+                    return self.finish(solution, start_time)
+
+                if self.is_out_of_time(start_time):
+                    return self.finish(solution, start_time)
 
                 if verbose:
                     self.log_solution(solution, start_time)
@@ -101,6 +112,9 @@ class ClimbingSumOfSubsetSolver(Solver):
         logger.info(f"Set limit to {limit} (default={self.DEFAULT_LIMIT})")
         logger.info(f"Set verbose to {verbose} (default=False)")
         logger.info(f"Set size to {size}")
+        self.prepare_time_limit(**kwargs)
+        self.prepare_trajectory(**kwargs)
+        self.prepare_restarts(**kwargs)
 
         start_time = time.time()
         random_solution = self.problem.generate_random_solution(size_of_subset=size)
@@ -108,32 +122,45 @@ class ClimbingSumOfSubsetSolver(Solver):
         self.add_attempt()
 
         if random_solution.is_optimal():
-            self.log_solution(random_solution, start_time)
-            return random_solution
+            return self.finish(random_solution, start_time)
+
+        if self.stagnation:
+            self.track_stagnation(random_solution)
 
         for _ in range(1, limit):
+            if self.is_out_of_time(start_time):
+                break
+
             self.add_attempt()
 
             close_neighbor = self.problem.find_close_neighbor(random_solution)
 
             if close_neighbor.is_optimal():
-                self.log_solution(close_neighbor, start_time)
-                return close_neighbor
+                return self.finish(close_neighbor, start_time)
 
             if close_neighbor > random_solution:
                 random_solution = close_neighbor
 
+            if self.stagnation and self.track_stagnation(random_solution):
+                random_solution = self.restart_from(random_solution, size_of_subset=size)
+
+                if random_solution.is_optimal():
+                    return self.finish(random_solution, start_time)
+
+            self.record_trajectory(random_solution, self.best_solution)
+
             if verbose:
                 self.log_solution(close_neighbor, start_time)
 
-        self.log_solution(random_solution, start_time)
-        return random_solution
+        # with restarts current solution can be worse than the best one found before
+        return self.finish(self.best_solution if self.stagnation else random_solution, start_time)
 
 
 class SimulatedAnnealingSumOfSubsetSolver(Solver):
     """ class which implements SimulatedAnnealing algorithm for SumOfSubset"""
 
     DEFAULT_LIMIT = 1000000
+    RESTARTS = ("restart", "kick", "reheat")
 
     def solve(self, **kwargs):
         self.log_welcome()
@@ -146,6 +173,9 @@ class SimulatedAnnealingSumOfSubsetSolver(Solver):
         logger.info(f"Set limit to {limit} (default={self.DEFAULT_LIMIT})")
         logger.info(f"Set verbose to {verbose} (default=False)")
         logger.info(f"Set size to {size}")
+        self.prepare_time_limit(**kwargs)
+        self.prepare_trajectory(**kwargs)
+        self.prepare_restarts(**kwargs)
 
         start_time = time.time()
         random_solution = self.problem.generate_random_solution(size_of_subset=size)
@@ -153,21 +183,30 @@ class SimulatedAnnealingSumOfSubsetSolver(Solver):
         self.add_attempt()
 
         if random_solution.is_optimal():
-            self.log_solution(random, start_time)
-            return random_solution
+            return self.finish(random_solution, start_time)
+
+        # best solution is tracked only for trajectory, SA returns its current solution
+        best_solution = random_solution
+        # temperature is function of attempts since start (or last restart/reheat)
+        reheated_at = 0
+
+        if self.stagnation:
+            self.track_stagnation(random_solution)
 
         for _ in range(1, limit):
+            if self.is_out_of_time(start_time):
+                break
+
             self.add_attempt()
             close_neighbor = self.problem.find_close_neighbor(random_solution)
 
             if close_neighbor.is_optimal():
-                self.log_solution(close_neighbor, start_time)
-                return close_neighbor
+                return self.finish(close_neighbor, start_time)
 
             if close_neighbor > random_solution:
                 random_solution = close_neighbor
             else:
-                i = self.report.get("attempts")
+                i = self.report.get("attempts") - reheated_at
                 random_number = random.random()
                 sa_condition = math.exp(
                     -(abs(close_neighbor.goal() - random_solution.goal()) / temperature(i))
@@ -176,11 +215,30 @@ class SimulatedAnnealingSumOfSubsetSolver(Solver):
                 if random_number < sa_condition:
                     random_solution = close_neighbor
 
+            if self.stagnation and self.track_stagnation(random_solution):
+                random_solution = self.restart_from(random_solution, size_of_subset=size)
+                # as at the start, the restarting attempt is the first one
+                reheated_at = self.report["attempts"] - 1
+
+                if random_solution.is_optimal():
+                    return self.finish(random_solution, start_time)
+
+            if self.trajectory is not None:
+                if random_solution > best_solution:
+                    best_solution = random_solution
+                self.record_trajectory(
+                    random_solution,
+                    best_solution,
+                    lambda iteration: temperature(iteration - reheated_at),
+                )
+
             if verbose:
                 self.log_solution(close_neighbor, start_time)
 
-        self.log_solution(random_solution, start_time)
-        return random_solution
+        # with restarts the best solution is returned, as current one can be far from it
+        return self.finish(
+            self.best_solution if self.stagnation else random_solution, start_time, best_solution
+        )
 
 
 class TabuSumOfSubsetSolver(Solver):
@@ -204,6 +262,8 @@ class TabuSumOfSubsetSolver(Solver):
         logger.info(f"Set limit to {limit} (default={self.DEFAULT_LIMIT})")
         logger.info(f"Set verbose to {verbose} (default=False)")
         logger.info(f"Set size to {size}")
+        self.prepare_time_limit(**kwargs)
+        self.prepare_trajectory(**kwargs)
 
         current_tabu_count = 0
 
@@ -215,10 +275,12 @@ class TabuSumOfSubsetSolver(Solver):
         tabu_list = []
 
         if random_solution.is_optimal():
-            self.log_solution(random_solution, start_time)
-            return random_solution
+            return self.finish(random_solution, start_time)
 
         for _ in range(1, limit):
+            if self.is_out_of_time(start_time):
+                break
+
             self.add_attempt()
             if tabu_list and current_tabu_count == tabu_count:
                 logger.info("Removed item from tabu_list")
@@ -234,8 +296,7 @@ class TabuSumOfSubsetSolver(Solver):
             close_neighbor = self.problem.find_close_neighbor(random_solution)
 
             if close_neighbor.is_optimal():
-                self.log_solution(close_neighbor, start_time)
-                return close_neighbor
+                return self.finish(close_neighbor, start_time)
 
             if close_neighbor in tabu_list:
                 logger.info(f"{close_neighbor} found in tabu_list")
@@ -245,11 +306,12 @@ class TabuSumOfSubsetSolver(Solver):
                 tabu_list.append(random_solution)
                 random_solution = close_neighbor
 
+            self.record_trajectory(random_solution)
+
             if verbose:
                 self.log_solution(close_neighbor, start_time)
 
-        self.log_solution(random_solution, start_time)
-        return random_solution
+        return self.finish(random_solution, start_time)
 
 
 class SumOfSubsetProblem(Problem):
@@ -266,6 +328,47 @@ class SumOfSubsetProblem(Problem):
         super().__init__(data)
         self.set = self.data["set"]
         self.number = self.data["number"]
+        self.binary_path = None
+        self.index = None
+
+    @classmethod
+    def from_binary(cls, file_path: str) -> "SumOfSubsetProblem":
+        """ method to open problem from binary file
+            set is memory-mapped (read-only numpy array), it is not copied
+        """
+        from sum_of_subset_problem.binary import (  # pylint: disable=import-outside-toplevel
+            read_binary,
+        )
+
+        problem = cls(read_binary(file_path))
+        problem.binary_path = file_path
+        return problem
+
+    def export_to_binary(self, file_path: str):
+        """ method to export problem to binary file """
+        from sum_of_subset_problem.binary import (  # pylint: disable=import-outside-toplevel
+            write_binary,
+        )
+
+        write_binary(self.data, file_path)
+
+    def __reduce_ex__(self, protocol):
+        # memory-mapped problem is sent to other processes as path, so they map the same file
+        if self.binary_path:
+            return self.__class__.from_binary, (self.binary_path,)
+        return super().__reduce_ex__(protocol)
+
+    def contains(self, subset) -> bool:
+        """ checks if subset is contained in set (with multiplicity), index is built once """
+        if self.index is None:
+            self.index = build_index(self.set)
+        return is_contained(self.index, subset)
+
+    def count(self, number) -> int:
+        """ returns how many times number is in set, index is built once """
+        if self.index is None:
+            self.index = build_index(self.set)
+        return count_in_index(self.index, number)
 
     def generate_random_solution(self, **kwargs) -> SumOfSubsetSolution:
         size_of_subset = kwargs.get("size_of_subset")
@@ -276,16 +379,24 @@ class SumOfSubsetProblem(Problem):
                 f'"size_of_subset" is not provided or it is not correct, set to {size_of_subset}'
             )
 
+        # sampling indices works for lists and numpy arrays
+        indices = random.sample(range(len(self.set)), size_of_subset)
+
         return SumOfSubsetSolution(
-            data={"subset": random.sample(self.set, size_of_subset)}, problem=self
+            data={"subset": [int(self.set[idx]) for idx in indices]}, problem=self
         )
 
     def find_close_neighbor(self, solution: SumOfSubsetSolution) -> SumOfSubsetSolution:
         new_subset = solution.subset[:]
 
-        first_element, second_element = random.choices(self.set, k=2)
+        first_element, second_element = (
+            int(element) for element in random.choices(self.set, k=2)
+        )
 
-        if first_element in solution.subset:
+        # chosen element is one of the copies of number in set, it is removed
+        # if that copy is in subset (with probability of used copies) or added otherwise
+        used, available = new_subset.count(first_element), self.count(first_element)
+        if used and (used >= available or random.random() * available < used):
             new_subset.remove(first_element)
         else:
             new_subset.append(first_element)
@@ -293,7 +404,7 @@ class SumOfSubsetProblem(Problem):
         if second_element in solution.subset and second_element in new_subset:
             if random.randint(1, 2) == 1:
                 new_subset.remove(second_element)
-        else:
+        elif new_subset.count(second_element) < self.count(second_element):
             if random.randint(1, 2) == 1:
                 new_subset.append(second_element)
 
@@ -303,74 +414,28 @@ class SumOfSubsetProblem(Problem):
 class SumOfSubsetExperiment(Experiment):
     """ class implementing SumOfSubset experiment """
 
-    def __init__(self, data=None):
-        super().__init__(data)
+    def __init__(self, data=None, store=None):
+        super().__init__(data, store)
 
     @property
     def problem_class(self) -> SumOfSubsetProblem:
         """ returns SumOfSubsetProblem"""
         return SumOfSubsetProblem
 
-    @staticmethod
-    def _prepare_bar_plot(bars, values, matplotlib_ax):
-        """ helper method to prepare extended bar plot """
-        for idx, rect in enumerate(bars):
-            height = rect.get_height()
-            matplotlib_ax.text(
-                rect.get_x() + rect.get_width() / 2,
-                0.5 * height,
-                values[idx],
-                ha="center",
-                va="bottom",
-                rotation=90,
-            )
-
-    def _prepare_plots(self, path):
-        """ helper method to prepare plots """
-        data = self.data.get("report")
-        times_for_problems = {}
-        solvers_for_problems = {}
-
-        for problem_idx, _ in enumerate(data):
-            for report in data[problem_idx]:
-                if not problem_idx in times_for_problems:
-                    times_for_problems[problem_idx] = []
-                if not problem_idx in solvers_for_problems:
-                    solvers_for_problems[problem_idx] = []
-
-                times_for_problems[problem_idx].append(report["report"]["time"])
-                solvers_for_problems[problem_idx].append(f"{report['solver_id'] + 1}: {self.data['solvers'][report.get('solver_id')].get('solver_name')}")
-
-
-        for problem_idx, results in times_for_problems.items():
-            plt.figure()
-
-            _, matplotlib_ax = plt.subplots()
-            y_values = [str(n) for n in range(len(results))]
-
-            bars = plt.bar(y_values, results)
-
-            plt.title(f"Performance for {problem_idx + 1} problem")
-            plt.ylabel("Time (in s)")
-
-            labels = []
-
-            for idx, _ in enumerate(results):
-                labels.append(
-                    f"{round(results[idx], 5)}  (solver {solvers_for_problems.get(problem_idx)[idx]})"
-                )
-
-            self._prepare_bar_plot(bars, labels, matplotlib_ax)
-            plt.savefig(os.path.join(path, f"{problem_idx}.png"))
-
     def build_html_report(self, path: str):
-        """ method to build HTML report """
+        """ method to build HTML report
+            plots are embedded in report.html as inline SVG
+        """
+        # imported here, so solving problems does not pay for templating and numpy
+        import jinja2  # pylint: disable=import-outside-toplevel
+        from sum_of_subset_problem.report import (  # pylint: disable=import-outside-toplevel
+            prepare_plots,
+        )
+
         logger.info("Building HTML report")
         env = jinja2.Environment(loader=jinja2.PackageLoader("sum_of_subset_problem", "static"))
 
         template = env.get_template("report.html")
 
         with open(os.path.join(path, "report.html"), "w") as report_html:
-            report_html.write(template.render(report=self.data))
-
-        self._prepare_plots(path)
+            report_html.write(template.render(report=self.data, plots=prepare_plots(self.data)))
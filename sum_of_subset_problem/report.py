@@ -0,0 +1,213 @@
+""" module with helpers to build HTML reports (aggregation and inline SVG plots) """
+import html
+import warnings
+from typing import Dict, List
+
+import numpy as np
+
+SVG_WIDTH = 640
+SVG_HEIGHT = 320
+SVG_MARGIN = 50
+MAX_LABELED_BARS = 40
+COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2")
+
+
+def _runs_for_problem(report: dict, idx_of_problem: int) -> List[dict]:
+    """ helper to get runs of problem (keys are strings after loading report from JSON) """
+    return report.get(idx_of_problem) or report.get(str(idx_of_problem)) or []
+
+
+def aggregate_report(data: dict) -> Dict[str, np.ndarray]:
+    """ function to gather experiment report into arrays of shape (problems, solvers)
+        missing runs are filled with nan
+    """
+    shape = (len(data.get("problems", [])), len(data.get("solvers", [])))
+    aggregated = {
+        "time": np.full(shape, np.nan),
+        "attempts": np.full(shape, np.nan),
+        "goal": np.full(shape, np.nan),
+    }
+
+    for idx_of_problem in range(shape[0]):
+        for run in _runs_for_problem(data.get("report", {}), idx_of_problem):
+            idx_of_solver = run["solver_id"]
+            aggregated["time"][idx_of_problem, idx_of_solver] = run["report"]["time"]
+            aggregated["attempts"][idx_of_problem, idx_of_solver] = run["report"]["attempts"]
+            if run.get("goal") is not None:
+                aggregated["goal"][idx_of_problem, idx_of_solver] = run["goal"]
+
+    return aggregated
+
+
+def bar_chart_svg(values, labels: List[str], title: str, y_label: str) -> str:
+    """ function to render bar chart as inline SVG
+        nan values are drawn as empty bars
+        labels are drawn only if there are not too many bars (they are kept in tooltips)
+    """
+    values = np.nan_to_num(np.asarray(values, dtype=float), nan=0.0)
+    plot_width = SVG_WIDTH - 2 * SVG_MARGIN
+    plot_height = SVG_HEIGHT - 2 * SVG_MARGIN
+    maximum = values.max() if values.size and values.max() > 0 else 1.0
+    bar_width = plot_width / max(len(values), 1)
+
+    elements = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{SVG_WIDTH}" height="{SVG_HEIGHT}" '
+        f'font-family="sans-serif" font-size="11">',
+        f'<text x="{SVG_WIDTH / 2}" y="20" text-anchor="middle" font-size="14">'
+        f"{html.escape(title)}</text>",
+        f'<text x="12" y="{SVG_HEIGHT / 2}" text-anchor="middle" '
+        f'transform="rotate(-90 12 {SVG_HEIGHT / 2})">{html.escape(y_label)}</text>',
+        f'<line x1="{SVG_MARGIN}" y1="{SVG_HEIGHT - SVG_MARGIN}" x2="{SVG_WIDTH - SVG_MARGIN}" '
+        f'y2="{SVG_HEIGHT - SVG_MARGIN}" stroke="black"/>',
+    ]
+
+    for idx, value in enumerate(values):
+        height = plot_height * value / maximum
+        x_position = SVG_MARGIN + idx * bar_width
+        y_position = SVG_HEIGHT - SVG_MARGIN - height
+        label = html.escape(labels[idx])
+        elements.append(
+            f'<rect x="{x_position + bar_width * 0.1:.2f}" y="{y_position:.2f}" '
+            f'width="{bar_width * 0.8:.2f}" height="{height:.2f}" fill="#1f77b4">'
+            f"<title>{label}: {value:.5g}</title></rect>"
+        )
+        if len(values) <= MAX_LABELED_BARS:
+            elements.append(
+                f'<text x="{x_position + bar_width / 2:.2f}" y="{SVG_HEIGHT - SVG_MARGIN + 14}" '
+                f'text-anchor="middle">{label}</text>'
+            )
+            elements.append(
+                f'<text x="{x_position + bar_width / 2:.2f}" y="{y_position - 4:.2f}" '
+                f'text-anchor="middle">{value:.5g}</text>'
+            )
+
+    elements.append("</svg>")
+    return "".join(elements)
+
+
+def line_chart_svg(series: Dict[str, tuple], title: str, x_label: str, y_label: str) -> str:
+    """ function to render line chart as inline SVG
+        series maps label to (x values, y values)
+    """
+    plot_width = SVG_WIDTH - 2 * SVG_MARGIN
+    plot_height = SVG_HEIGHT - 2 * SVG_MARGIN
+    arrays = {
+        label: (np.asarray(x_values, dtype=float), np.asarray(y_values, dtype=float))
+        for label, (x_values, y_values) in series.items()
+        if len(x_values)
+    }
+
+    elements = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{SVG_WIDTH}" height="{SVG_HEIGHT}" '
+        f'font-family="sans-serif" font-size="11">',
+        f'<text x="{SVG_WIDTH / 2}" y="20" text-anchor="middle" font-size="14">'
+        f"{html.escape(title)}</text>",
+        f'<text x="12" y="{SVG_HEIGHT / 2}" text-anchor="middle" '
+        f'transform="rotate(-90 12 {SVG_HEIGHT / 2})">{html.escape(y_label)}</text>',
+        f'<text x="{SVG_WIDTH / 2}" y="{SVG_HEIGHT - 10}" text-anchor="middle">'
+        f"{html.escape(x_label)}</text>",
+        f'<line x1="{SVG_MARGIN}" y1="{SVG_HEIGHT - SVG_MARGIN}" x2="{SVG_WIDTH - SVG_MARGIN}" '
+        f'y2="{SVG_HEIGHT - SVG_MARGIN}" stroke="black"/>',
+    ]
+
+    if arrays:
+        x_min = min(x_values.min() for x_values, _ in arrays.values())
+        x_max = max(x_values.max() for x_values, _ in arrays.values())
+        y_min = min(min(y_values.min(), 0) for _, y_values in arrays.values())
+        y_max = max(y_values.max() for _, y_values in arrays.values())
+        x_range = (x_max - x_min) or 1.0
+        y_range = (y_max - y_min) or 1.0
+
+        for idx, (label, (x_values, y_values)) in enumerate(arrays.items()):
+            x_positions = SVG_MARGIN + plot_width * (x_values - x_min) / x_range
+            y_positions = SVG_HEIGHT - SVG_MARGIN - plot_height * (y_values - y_min) / y_range
+            points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(x_positions, y_positions))
+            color = COLORS[idx % len(COLORS)]
+            elements.append(
+                f'<polyline points="{points}" fill="none" stroke="{color}">'
+                f"<title>{html.escape(label)}</title></polyline>"
+            )
+            elements.append(
+                f'<text x="{SVG_WIDTH - SVG_MARGIN}" y="{SVG_MARGIN + 14 * idx}" '
+                f'text-anchor="end" fill="{color}">{html.escape(label)}</text>'
+            )
+
+        elements.append(
+            f'<text x="{SVG_MARGIN - 4}" y="{SVG_MARGIN}" text-anchor="end">{y_max:.5g}</text>'
+        )
+        elements.append(
+            f'<text x="{SVG_MARGIN - 4}" y="{SVG_HEIGHT - SVG_MARGIN}" text-anchor="end">'
+            f"{y_min:.5g}</text>"
+        )
+
+    elements.append("</svg>")
+    return "".join(elements)
+
+
+def prepare_convergence_plot(data: dict, idx_of_problem: int, solver_labels: List[str]) -> str:
+    """ function to plot best goal over iterations for runs which recorded trajectory
+        returns empty string if there are no such runs
+    """
+    series = {}
+    for run in _runs_for_problem(data.get("report", {}), idx_of_problem):
+        trajectory = run["report"].get("trajectory")
+        if trajectory:
+            series[solver_labels[run["solver_id"]]] = (trajectory["iteration"], trajectory["best"])
+
+    if not series:
+        return ""
+
+    return line_chart_svg(
+        series, f"Convergence for {idx_of_problem + 1} problem", "Iteration", "Best goal"
+    )
+
+
+def prepare_plots(data: dict) -> Dict[str, object]:
+    """ function to prepare all the plots of report as inline SVG
+        returns dict with plots (and convergence plots) for every problem and summary plots
+    """
+    aggregated = aggregate_report(data)
+    solver_labels = [
+        f"{idx + 1}: {solver.get('solver_name')}" for idx, solver in enumerate(data["solvers"])
+    ]
+    problem_labels = [str(idx + 1) for idx in range(len(data["problems"]))]
+
+    problems = {}
+    convergence = {}
+    for idx_of_problem in range(len(data["problems"])):
+        convergence[idx_of_problem] = prepare_convergence_plot(data, idx_of_problem, solver_labels)
+        problems[idx_of_problem] = bar_chart_svg(
+            aggregated["time"][idx_of_problem],
+            solver_labels,
+            f"Performance for {idx_of_problem + 1} problem",
+            "Time (in s)",
+        )
+
+    summary = []
+    if aggregated["time"].size:
+        # solvers without any run give nan averages, which are drawn as empty bars
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            optimal = np.where(np.isnan(aggregated["goal"]), np.nan, aggregated["goal"] == 0)
+            summary = [
+                bar_chart_svg(
+                    np.nanmean(aggregated["time"], axis=0),
+                    solver_labels,
+                    "Average time for solver",
+                    "Time (in s)",
+                ),
+                bar_chart_svg(
+                    np.nanmean(optimal, axis=0) * 100,
+                    solver_labels,
+                    "Optimal solutions for solver",
+                    "Optimal (in %)",
+                ),
+                bar_chart_svg(
+                    np.nansum(aggregated["time"], axis=1),
+                    problem_labels,
+                    "Total time for problem",
+                    "Time (in s)",
+                ),
+            ]
+
+    return {"problems": problems, "convergence": convergence, "summary": summary}
@@ -0,0 +1,284 @@
+""" module with long-running solve service
+    requests are JSON lines sent over Unix socket:
+        {"id": ..., "problem": {"set": [...], "number": ...}, "solver": "climbing",
+         "params": {...}, "time_budget": 1.0}
+    they are grouped into batches (split between idle workers) and solved in warm process pool,
+    responses ({"id": ..., "solution": ..., "goal": ..., "report": ...} or {"id": ..., "error": ...})
+    are streamed back as JSON lines in order of completion
+    params are passed to solver as they are (lambdas are not evaluated)
+"""
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from sum_of_subset_problem import logger
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_BATCH_DELAY = 0.005
+DEFAULT_MAX_PENDING = 1024
+
+
+def _warm_up():
+    """ initializer of worker processes, imports solvers once and silences their logs """
+    import sum_of_subset_problem.problem  # pylint: disable=import-outside-toplevel,unused-import
+
+    logger.setLevel("WARNING")
+
+
+def solve_single(payload: dict) -> dict:
+    """ function to solve single request, errors are returned in response """
+    from sum_of_subset_problem.problem import (  # pylint: disable=import-outside-toplevel
+        SumOfSubsetProblem,
+    )
+
+    response = {"id": payload.get("id")}
+    try:
+        problem = SumOfSubsetProblem(payload["problem"])
+        solver_class = problem.solvers.get(payload.get("solver", "climbing"))
+        if solver_class is None:
+            raise ValueError(f"Unknown solver {payload.get('solver')}")
+
+        params = dict(payload.get("params") or {})
+        if payload.get("time_budget") is not None:
+            params["time_limit"] = payload["time_budget"]
+
+        solver = solver_class(problem)
+        solution = solver.solve(**params)
+    except Exception as error:  # pylint: disable=broad-except
+        response["error"] = f"{error.__class__.__name__}: {error}"
+        return response
+
+    response["solution"] = list(solution.subset) if solution is not None else None
+    response["goal"] = solution.goal() if solution is not None else None
+    response["report"] = solver.report
+    return response
+
+
+def solve_batch(payloads: List[dict]) -> List[dict]:
+    """ function to solve batch of requests in worker process """
+    return [solve_single(payload) for payload in payloads]
+
+
+class SolveService:
+    """ class implementing asyncio solve service
+        backpressure: when max_pending requests are waiting, connections are not read further
+        and only workers * 2 batches are dispatched to process pool at once
+    """
+
+    def __init__(
+            self,
+            socket_path: str,
+            workers: Optional[int] = None,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            batch_delay: float = DEFAULT_BATCH_DELAY,
+            max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self.socket_path = socket_path
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self.pool = None
+        self.server = None
+        self.queue = None
+        self.slots = None
+        self.batcher = None
+        self.dispatched = set()
+        self.handlers = set()
+        self.closing = False
+
+    async def start(self):
+        """ method to start worker pool and listen on socket """
+        # workers are spawned, as forking process with running event loop (and threads) is unsafe
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_up,
+        )
+        loop = asyncio.get_running_loop()
+        # spawn all the workers before first request comes
+        await asyncio.gather(
+            *[loop.run_in_executor(self.pool, solve_batch, []) for _ in range(self.workers)]
+        )
+
+        self.queue = asyncio.Queue(maxsize=self.max_pending)
+        self.slots = asyncio.Semaphore(self.workers * 2)
+        self.batcher = asyncio.create_task(self._batch_requests())
+        self.server = await asyncio.start_unix_server(self._handle_connection, self.socket_path)
+        logger.info(f"Listening on {self.socket_path} with {self.workers} workers")
+
+    async def close(self):
+        """ method to stop listening and shut down worker pool
+            batches already dispatched are finished, requests not dispatched yet get error,
+            then connections are closed (wait_closed waits for them since python 3.12)
+        """
+        self.closing = True
+        self.server.close()
+
+        self.batcher.cancel()
+        await asyncio.gather(self.batcher, return_exceptions=True)
+        while not self.queue.empty():
+            self._reject([self.queue.get_nowait()])
+        await asyncio.gather(*self.dispatched, return_exceptions=True)
+
+        # handlers write remaining responses and close their connections when cancelled
+        for handler in list(self.handlers):
+            handler.cancel()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+        # shutdown waits for worker processes, so it is run outside of event loop thread
+        await asyncio.get_running_loop().run_in_executor(None, self.pool.shutdown)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def serve_forever(self):
+        """ method to run service until it is cancelled """
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _handle_connection(self, reader, writer):
+        """ method to read requests of single connection and write its responses
+            it is cancelled by close, requests which were not dispatched then get error
+        """
+        loop = asyncio.get_running_loop()
+        handler = asyncio.current_task()
+        self.handlers.add(handler)
+        # requests and responses are forgotten as soon as they are done
+        requests = {}
+        responses = set()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                future = loop.create_future()
+                response = asyncio.create_task(self._respond(future, writer))
+                responses.add(response)
+                response.add_done_callback(responses.discard)
+                try:
+                    payload = json.loads(line)
+                except ValueError as error:
+                    future.set_result({"id": None, "error": f"Invalid JSON: {error}"})
+                    continue
+
+                if not isinstance(payload, dict):
+                    future.set_result({"id": None, "error": "Expected dict"})
+                elif self.closing:
+                    self._reject([(payload, future)])
+                else:
+                    requests[future] = payload
+                    future.add_done_callback(lambda done: requests.pop(done, None))
+                    await self.queue.put((payload, future))
+        except asyncio.CancelledError:
+            # close has already finished dispatched batches, so waiting requests are not solved
+            self._reject([(payload, future) for future, payload in list(requests.items())])
+            raise
+        finally:
+            await asyncio.gather(*responses, return_exceptions=True)
+            writer.close()
+            await asyncio.gather(writer.wait_closed(), return_exceptions=True)
+            self.handlers.discard(handler)
+
+    @staticmethod
+    async def _respond(future, writer):
+        """ method to write response as soon as it is ready """
+        response = await future
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+    @staticmethod
+    def _reject(batch: list):
+        """ method to resolve futures of requests which will not be solved (service is closing) """
+        for payload, future in batch:
+            if not future.done():
+                future.set_result({"id": payload.get("id"), "error": "Service is closing"})
+
+    def _batch_limit(self, queued: int) -> int:
+        """ returns size of next batch, so queued requests are spread over idle workers
+            (over all the workers if none is idle), batching never costs parallelism
+        """
+        idle = self.workers - len(self.dispatched)
+        limit = math.ceil(queued / (idle if idle > 0 else self.workers))
+        return max(1, min(self.batch_size, limit))
+
+    async def _batch_requests(self):
+        """ method to group queued requests into batches
+            it waits batch_delay for burst of requests and splits it between workers
+        """
+        while True:
+            batch = [await self.queue.get()]
+
+            try:
+                await asyncio.sleep(self.batch_delay)
+                limit = self._batch_limit(len(batch) + self.queue.qsize())
+                while len(batch) < limit and not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+
+                await self.slots.acquire()
+            except asyncio.CancelledError:
+                self._reject(batch)
+                raise
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self.dispatched.add(task)
+            task.add_done_callback(self.dispatched.discard)
+
+    async def _dispatch(self, batch: list):
+        """ method to solve batch in process pool and resolve its futures """
+        loop = asyncio.get_running_loop()
+        payloads = [payload for payload, _ in batch]
+
+        try:
+            responses = await loop.run_in_executor(self.pool, solve_batch, payloads)
+        except Exception as error:  # pylint: disable=broad-except
+            responses = [
+                {"id": payload.get("id"), "error": f"{error.__class__.__name__}: {error}"}
+                for payload in payloads
+            ]
+        finally:
+            self.slots.release()
+
+        for (_, future), response in zip(batch, responses):
+            future.set_result(response)
+
+
+async def solve_remote(socket_path: str, payloads: List[dict]) -> List[dict]:
+    """ client function to send requests to service, returns responses in order of completion """
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+
+    async def send():
+        for payload in payloads:
+            writer.write(json.dumps(payload).encode() + b"\n")
+            await writer.drain()
+        writer.write_eof()
+
+    sender = asyncio.create_task(send())
+    responses = []
+    for _ in payloads:
+        line = await reader.readline()
+        if not line:
+            break
+        responses.append(json.loads(line))
+
+    await sender
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def run_service(socket_path: str, **kwargs):
+    """ function to run service until it is interrupted """
+    try:
+        asyncio.run(SolveService(socket_path, **kwargs).serve_forever())
+    except KeyboardInterrupt:
+        logger.info("Service stopped")
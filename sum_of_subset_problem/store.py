@@ -0,0 +1,179 @@
+""" module with SQLite-backed store for experiment results """
+import hashlib
+import json
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+from sum_of_subset_problem import logger
+
+
+def _to_json(value):
+    """ helper to serialize tuples, numpy arrays and numpy numbers """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return list(value)
+
+
+def hash_problem(problem_data: dict) -> str:
+    """ returns stable hash of problem data (independent of keys order) """
+    serialized = json.dumps(problem_data, sort_keys=True, default=_to_json)
+    return hashlib.sha1(serialized.encode()).hexdigest()
+
+
+def serialize_params(params: Optional[dict]) -> str:
+    """ returns stable representation of solver params """
+    return json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class ResultStore:
+    """ class to keep results of experiments in SQLite database
+        every (problem, solver, params, seed) run is a single row
+        written as soon as it is finished
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            problem_hash TEXT NOT NULL,
+            solver_name TEXT NOT NULL,
+            params TEXT NOT NULL,
+            seed TEXT,
+            goal INTEGER,
+            time REAL,
+            attempts INTEGER,
+            report TEXT NOT NULL,
+            solution TEXT,
+            created REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_runs_problem_hash ON runs (problem_hash);
+        CREATE INDEX IF NOT EXISTS idx_runs_solver_name ON runs (solver_name);
+        CREATE INDEX IF NOT EXISTS idx_runs_goal ON runs (goal);
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(self.SCHEMA)
+        self.connection.commit()
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> dict:
+        """ helper method to transform database row into dict """
+        result = dict(row)
+        result["params"] = json.loads(result["params"])
+        result["report"] = json.loads(result["report"])
+        result["solution"] = json.loads(result["solution"]) if result["solution"] else None
+        return result
+
+    def add_run(
+            self,
+            problem_hash: str,
+            solver_name: str,
+            params: Optional[dict],
+            seed,
+            report: dict,
+            solution: Optional[dict],
+            goal: Optional[int],
+    ) -> int:
+        """ method to save single run, returns its id """
+        cursor = self.connection.execute(
+            "INSERT INTO runs (problem_hash, solver_name, params, seed, goal, time, attempts, "
+            "report, solution, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                problem_hash,
+                solver_name,
+                serialize_params(params),
+                None if seed is None else str(seed),
+                goal,
+                report.get("time"),
+                report.get("attempts"),
+                json.dumps(report, default=str),
+                json.dumps(solution, default=_to_json) if solution is not None else None,
+                time.time(),
+            ),
+        )
+        self.connection.commit()
+        return cursor.lastrowid
+
+    def find_run(
+            self, problem_hash: str, solver_name: str, params: Optional[dict], seed=None
+    ) -> Optional[dict]:
+        """ method to find already finished run, returns None if it does not exist """
+        row = self.connection.execute(
+            "SELECT * FROM runs WHERE problem_hash = ? AND solver_name = ? AND params = ? "
+            "AND seed IS ? ORDER BY id DESC LIMIT 1",
+            (
+                problem_hash,
+                solver_name,
+                serialize_params(params),
+                None if seed is None else str(seed),
+            ),
+        ).fetchone()
+
+        return self._row_to_dict(row) if row else None
+
+    def runs_for_problem(self, problem_hash: str) -> List[dict]:
+        """ method to get all the runs for given problem, best first """
+        rows = self.connection.execute(
+            "SELECT * FROM runs WHERE problem_hash = ? ORDER BY goal < 0, goal, time",
+            (problem_hash,),
+        ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def runs_for_solver(self, solver_name: str, goal: Optional[int] = None) -> List[dict]:
+        """ method to get all the runs of given solver, optionally only with given goal """
+        if goal is None:
+            rows = self.connection.execute(
+                "SELECT * FROM runs WHERE solver_name = ? ORDER BY id", (solver_name,)
+            ).fetchall()
+        else:
+            rows = self.connection.execute(
+                "SELECT * FROM runs WHERE solver_name = ? AND goal = ? ORDER BY id",
+                (solver_name, goal),
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def summary(self) -> List[dict]:
+        """ method to get aggregated statistics for every solver """
+        rows = self.connection.execute(
+            "SELECT solver_name, COUNT(*) AS runs, SUM(goal = 0) AS optimal, "
+            "AVG(time) AS average_time, AVG(attempts) AS average_attempts "
+            "FROM runs GROUP BY solver_name ORDER BY solver_name"
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def build_report(self, problems: List[dict], solvers: List[dict], seed=None) -> Dict[int, list]:
+        """ method to build experiment report (same layout as Experiment.data["report"])
+            from runs matching given problems and solvers
+        """
+        report = {}
+        for idx_of_problem, problem_data in enumerate(problems):
+            problem_hash = hash_problem(problem_data)
+            for idx_of_solver, solver_item in enumerate(solvers):
+                run = self.find_run(
+                    problem_hash, solver_item.get("solver_name"), solver_item.get("params"), seed
+                )
+                if run is None:
+                    continue
+
+                report.setdefault(idx_of_problem, []).append(
+                    {
+                        "solver_id": idx_of_solver,
+                        "report": run["report"],
+                        "solution": run["solution"],
+                        "goal": run["goal"],
+                    }
+                )
+
+        logger.info(f"Built report for {len(report)} problems from {self.path}")
+        return report
+
+    def close(self):
+        """ method to close connection to database """
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
@@ -1,6 +1,9 @@
 import random
 from typing import Dict, List
 
+# distributions of generator module, kept here so cli does not import numpy to list them
+DISTRIBUTIONS = ("uniform", "hard", "negative", "infeasible")
+
 
 def generate_problem_with_solution(length_of_set: int, length_of_subset: int) -> Dict[Dict, List]:
     if length_of_subset > length_of_set:
@@ -12,7 +15,7 @@ def generate_problem_with_solution(length_of_set: int, length_of_subset: int) ->
     if length_of_subset <= 0:
         raise ValueError("Length of subset must be positive number")
 
-    set_of_numbers = [number for number in range(1, length_of_set)]
+    set_of_numbers = [number for number in range(1, length_of_set + 1)]
     subset_of_numbers = random.sample(set_of_numbers, length_of_subset)
     number = sum(subset_of_numbers)
 
@@ -0,0 +1,191 @@
+""" module to verify (many) solutions of SumOfSubset problems
+    solution is correct if it is not empty, sums to number
+    and every number is used at most as many times as it is in set
+"""
+import json
+import os
+import re
+import time
+from collections import Counter
+from typing import Iterator, List, Optional, Tuple, Union
+
+from sum_of_subset_problem import logger
+
+SORTED_INDEX_THRESHOLD = 10000
+MAX_EXAMPLES = 10
+
+
+def build_index(set_of_numbers) -> Union[Counter, "numpy.ndarray"]:
+    """ function to build multiset index of set
+        Counter for small lists, sorted numpy array for big sets and numpy arrays
+        already sorted numpy array (like memory-mapped set of binary file) is used as it is,
+        so processes which map the same file do not hold private copies of it
+    """
+    if hasattr(set_of_numbers, "dtype") or len(set_of_numbers) >= SORTED_INDEX_THRESHOLD:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        array = np.asarray(set_of_numbers, dtype=np.int64)
+        if (array[1:] >= array[:-1]).all():
+            return array
+
+        if isinstance(set_of_numbers, np.memmap):
+            logger.warning("Memory-mapped set is not sorted, its sorted copy is built")
+        return np.sort(array)
+
+    return Counter(set_of_numbers)
+
+
+def is_contained(index, subset) -> bool:
+    """ checks if subset is contained in indexed set (with multiplicity) """
+    if isinstance(index, Counter):
+        return all(index[number] >= count for number, count in Counter(subset).items())
+
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    values, counts = np.unique(np.asarray(subset, dtype=np.int64), return_counts=True)
+    available = np.searchsorted(index, values, "right") - np.searchsorted(index, values, "left")
+    return bool((available >= counts).all())
+
+
+def count_in_index(index, number) -> int:
+    """ returns how many times number is in indexed set """
+    if isinstance(index, Counter):
+        return index[number]
+
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    return int(np.searchsorted(index, number, "right") - np.searchsorted(index, number, "left"))
+
+
+def check_solution(index, number: int, subset) -> Optional[str]:
+    """ function to check single solution, returns reason of failure or None """
+    if not subset:
+        return "empty subset"
+
+    if sum(subset) != number:
+        return "wrong sum"
+
+    if not is_contained(index, subset):
+        return "not in set"
+
+    return None
+
+
+def _subset_of(solution) -> Optional[list]:
+    """ helper to get subset from solution (list, {"subset": ...} or None) """
+    if isinstance(solution, dict):
+        return solution.get("subset")
+    return solution
+
+
+def _problem_for_file(file_path: str, problems: Union[dict, List[dict], None]) -> Optional[dict]:
+    """ helper to find problem of file with solutions only
+        list of problems is matched by index at the end of file name (like solution_2.json)
+    """
+    if problems is None or isinstance(problems, dict):
+        return problems
+
+    match = re.search(r"(\d+)$", os.path.splitext(os.path.basename(file_path))[0])
+    if match and int(match.group(1)) < len(problems):
+        return problems[int(match.group(1))]
+
+    if len(problems) == 1:
+        return problems[0]
+
+    return None
+
+
+def iter_pairs(
+        file_path: str, problems: Union[dict, List[dict], None] = None
+) -> Iterator[Tuple[Optional[dict], Optional[list]]]:
+    """ generator of (problem, subset) pairs from file
+        JSONL file or JSON list/dict of {"problem": ..., "solution": ...} items,
+        or JSON file with solutions only (problem is taken from problems)
+    """
+    if file_path.endswith(".jsonl"):
+        with open(file_path) as input_file:
+            for line in input_file:
+                if line.strip():
+                    item = json.loads(line)
+                    yield item.get("problem"), _subset_of(item.get("solution"))
+        return
+
+    with open(file_path) as input_file:
+        data = json.load(input_file)
+
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        if isinstance(item, dict) and "problem" in item:
+            yield item["problem"], _subset_of(item.get("solution"))
+        else:
+            yield _problem_for_file(file_path, problems), _subset_of(item)
+
+
+def verify_file(file_path: str, problems: Union[dict, List[dict], None] = None) -> dict:
+    """ function to verify all the solutions from file, returns summary """
+    summary = {"file": file_path, "checked": 0, "correct": 0, "unsolved": 0, "failures": 0}
+    examples = []
+    indexed_problem, index = None, None
+
+    for idx, (problem, subset) in enumerate(iter_pairs(file_path, problems)):
+        summary["checked"] += 1
+
+        if problem is None:
+            reason = "missing problem"
+        elif not subset:
+            summary["unsolved"] += 1
+            continue
+        else:
+            try:
+                # solutions only files share their problem, so its index is built once
+                if problem is not indexed_problem:
+                    indexed_problem, index = problem, build_index(problem["set"])
+                reason = check_solution(index, problem["number"], subset)
+            except (KeyError, TypeError, ValueError, OverflowError) as error:
+                reason = f"invalid data ({error.__class__.__name__}: {error})"
+
+        if reason is None:
+            summary["correct"] += 1
+        else:
+            summary["failures"] += 1
+            if len(examples) < MAX_EXAMPLES:
+                examples.append({"item": idx, "reason": reason})
+
+    summary["examples"] = examples
+    return summary
+
+
+# problems of worker process, set once by pool initializer instead of being sent with every file
+_worker_problems = None
+
+
+def _set_worker_problems(problems: Union[dict, List[dict], None]):
+    """ initializer of worker processes, saves problems shared by all the files """
+    global _worker_problems  # pylint: disable=global-statement
+    _worker_problems = problems
+
+
+def _verify_file_in_worker(file_path: str) -> dict:
+    """ helper to verify file in worker process with problems set by initializer """
+    return verify_file(file_path, _worker_problems)
+
+
+def verify_files(
+        file_paths: List[str], problems: Union[dict, List[dict], None] = None, workers: int = None
+) -> Tuple[List[dict], float]:
+    """ function to verify files in parallel, returns summaries and time taken (in s) """
+    start_time = time.time()
+
+    if workers == 1 or len(file_paths) <= 1:
+        summaries = [verify_file(file_path, problems) for file_path in file_paths]
+    else:
+        from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+            ProcessPoolExecutor,
+        )
+
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=_set_worker_problems, initargs=(problems,)
+        ) as pool:
+            summaries = list(pool.map(_verify_file_in_worker, file_paths, chunksize=4))
+
+    return summaries, time.time() - start_time
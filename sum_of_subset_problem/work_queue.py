@@ -0,0 +1,273 @@
+""" module with file-based work queue to run experiments on many processes (or hosts)
+    queue is a directory (on filesystem shared by all the workers):
+        experiment.json - experiment data (and its hash) written by coordinator
+        pending/<task> - tasks waiting for worker
+        claimed/<task>@<lease expiration>@<worker> - tasks being solved (lease is renewed
+            by worker every third of lease, so only tasks of stopped workers expire)
+        results/<task>.json - finished tasks (or their errors, failed tasks are not retried)
+    every state change is atomic rename, so only one worker can claim given task
+"""
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+from typing import List, Optional
+
+from sum_of_subset_problem import logger
+
+DEFAULT_LEASE = 600
+DEFAULT_POLL = 1.0
+
+
+def hash_experiment(experiment_data: dict) -> str:
+    """ returns stable hash of experiment data (independent of keys order) """
+    serialized = json.dumps(experiment_data, sort_keys=True, default=str)
+    return hashlib.sha1(serialized.encode()).hexdigest()
+
+
+class WorkQueue:
+    """ class implementing directory-based queue of (problem, solver) tasks with leases """
+
+    def __init__(self, path: str, lease: float = DEFAULT_LEASE):
+        self.path = path
+        self.lease = lease
+        self.pending = os.path.join(path, "pending")
+        self.claimed = os.path.join(path, "claimed")
+        self.results = os.path.join(path, "results")
+        self.tasks = None
+
+        for directory in (self.pending, self.claimed, self.results):
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def task_name(idx_of_problem: int, idx_of_solver: int) -> str:
+        """ returns name of task for given problem and solver """
+        return f"{idx_of_problem:08d}-{idx_of_solver:04d}"
+
+    @staticmethod
+    def _write_atomic(file_path: str, data):
+        """ helper to write JSON file, so readers never see partial content """
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as output_file:
+            output_file.write(json.dumps(data))
+        os.replace(temporary_path, file_path)
+
+    def submit(self, experiment_data: dict) -> int:
+        """ method to save experiment and queue all its (problem, solver) tasks
+            tasks with results are not queued again, returns number of queued tasks
+            queue of other experiment is not reused (its results would be collected)
+        """
+        data = {key: value for key, value in experiment_data.items() if key != "report"}
+        experiment_hash = hash_experiment(data)
+
+        if self.is_submitted() and self.experiment_hash() != experiment_hash:
+            raise ValueError(f"Queue {self.path} belongs to other experiment")
+
+        count = 0
+        for idx_of_problem, _ in enumerate(data.get("problems", [])):
+            for idx_of_solver, _ in enumerate(data.get("solvers", [])):
+                name = self.task_name(idx_of_problem, idx_of_solver)
+                if os.path.exists(os.path.join(self.results, f"{name}.json")):
+                    continue
+                self._write_atomic(
+                    os.path.join(self.pending, name),
+                    {"problem_idx": idx_of_problem, "solver_idx": idx_of_solver},
+                )
+                count += 1
+
+        # experiment is saved after tasks, so workers do not find empty queue
+        self._write_atomic(
+            os.path.join(self.path, "experiment.json"),
+            {"hash": experiment_hash, "experiment": data},
+        )
+        logger.info(f"Queued {count} tasks in {self.path}")
+        return count
+
+    def is_submitted(self) -> bool:
+        """ checks if coordinator has already submitted experiment """
+        return os.path.exists(os.path.join(self.path, "experiment.json"))
+
+    def _read_submitted(self) -> dict:
+        """ helper to read experiment.json saved by coordinator """
+        with open(os.path.join(self.path, "experiment.json")) as input_file:
+            return json.load(input_file)
+
+    def experiment_data(self) -> dict:
+        """ method to read experiment data saved by coordinator """
+        return self._read_submitted()["experiment"]
+
+    def experiment_hash(self) -> Optional[str]:
+        """ method to read hash of experiment saved by coordinator """
+        return self._read_submitted().get("hash")
+
+    def claim(self, worker_id: str) -> Optional[dict]:
+        """ method to claim first free task, returns None if there is no such task """
+        for name in sorted(os.listdir(self.pending)):
+            if name.endswith(".tmp"):
+                continue
+
+            claimed_name = f"{name}@{time.time() + self.lease:.3f}@{worker_id}"
+            try:
+                os.rename(
+                    os.path.join(self.pending, name), os.path.join(self.claimed, claimed_name)
+                )
+            except FileNotFoundError:
+                # claimed by other worker in the meantime
+                continue
+
+            with open(os.path.join(self.claimed, claimed_name)) as input_file:
+                task = json.load(input_file)
+            task["name"] = name
+            task["claimed_name"] = claimed_name
+            return task
+
+        return None
+
+    def renew(self, task: dict) -> bool:
+        """ method to extend lease of claimed task, returns False if task was re-queued """
+        name, _, worker_id = task["claimed_name"].split("@", 2)
+        claimed_name = f"{name}@{time.time() + self.lease:.3f}@{worker_id}"
+        try:
+            os.rename(
+                os.path.join(self.claimed, task["claimed_name"]),
+                os.path.join(self.claimed, claimed_name),
+            )
+        except FileNotFoundError:
+            return False
+
+        task["claimed_name"] = claimed_name
+        return True
+
+    def complete(self, task: dict, result: dict):
+        """ method to save result of task and remove it from queue """
+        self._write_atomic(os.path.join(self.results, f"{task['name']}.json"), result)
+
+        # task could be re-queued if lease expired, its result is already saved
+        for file_path in (
+                os.path.join(self.claimed, task["claimed_name"]),
+                os.path.join(self.pending, task["name"]),
+        ):
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+
+    def requeue_expired(self) -> int:
+        """ method to move tasks with expired leases back to pending, returns their number """
+        count = 0
+        now = time.time()
+
+        for claimed_name in os.listdir(self.claimed):
+            name, expiration, worker_id = claimed_name.split("@", 2)
+            if float(expiration) > now:
+                continue
+
+            try:
+                os.rename(
+                    os.path.join(self.claimed, claimed_name), os.path.join(self.pending, name)
+                )
+            except FileNotFoundError:
+                continue
+
+            logger.warning(f"Lease of {name} (worker={worker_id}) expired, task re-queued")
+            count += 1
+
+        return count
+
+    def task_count(self) -> int:
+        """ returns number of (problem, solver) tasks of submitted experiment """
+        if self.tasks is None:
+            data = self.experiment_data()
+            self.tasks = len(data.get("problems", [])) * len(data.get("solvers", []))
+        return self.tasks
+
+    def is_finished(self) -> bool:
+        """ checks if every task of submitted experiment has its result
+            (pending and claimed directories cannot be listed at once,
+            so task re-queued in the meantime could be missed)
+        """
+        results = [name for name in os.listdir(self.results) if name.endswith(".json")]
+        return len(results) >= self.task_count()
+
+    def collect(self) -> List[dict]:
+        """ method to read all the results """
+        results = []
+        for name in sorted(os.listdir(self.results)):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(self.results, name)) as input_file:
+                results.append(json.load(input_file))
+        return results
+
+
+class LeaseHeartbeat(threading.Thread):
+    """ thread renewing lease of task while it is solved (use as context manager) """
+
+    def __init__(self, work_queue: WorkQueue, task: dict):
+        super().__init__(daemon=True)
+        self.work_queue = work_queue
+        self.task = task
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.work_queue.lease / 3):
+            if not self.work_queue.renew(self.task):
+                logger.warning(f"Lease of {self.task['name']} was lost, task could be re-run")
+                return
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        # heartbeat is stopped before task is completed, so claimed name does not change
+        self.stopped.set()
+        self.join()
+
+
+def run_worker(
+        path: str,
+        experiment_class,
+        worker_id: Optional[str] = None,
+        lease: float = DEFAULT_LEASE,
+        poll: float = DEFAULT_POLL,
+) -> int:
+    """ function to solve tasks from queue until it is finished, returns number of solved tasks """
+    work_queue = WorkQueue(path, lease)
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+
+    while not work_queue.is_submitted():
+        time.sleep(poll)
+
+    experiment = experiment_class(work_queue.experiment_data())
+
+    count = 0
+    while True:
+        work_queue.requeue_expired()
+        task = work_queue.claim(worker_id)
+
+        if task is None:
+            if work_queue.is_finished():
+                break
+            time.sleep(poll)
+            continue
+
+        logger.info(f"Worker {worker_id} claimed {task['name']}")
+        with LeaseHeartbeat(work_queue, task):
+            try:
+                result = experiment.run_task(task["problem_idx"], task["solver_idx"])
+            except Exception as error:  # pylint: disable=broad-except
+                # failing task (like wrong solver params) would fail again, so it is not re-queued
+                logger.error(f"Worker {worker_id} failed to solve {task['name']}: {error}")
+                result = {
+                    "solver_id": task["solver_idx"],
+                    "error": f"{error.__class__.__name__}: {error}",
+                }
+        result["problem_idx"] = task["problem_idx"]
+        work_queue.complete(task, result)
+        count += 1
+
+    logger.info(f"Worker {worker_id} finished after {count} tasks")
+    return count
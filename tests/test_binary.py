@@ -0,0 +1,80 @@
+import json
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from sum_of_subset_problem.binary import binary_to_json, json_to_binary, read_binary, write_binary
+from sum_of_subset_problem.problem import (
+    ClimbingSumOfSubsetSolver,
+    SumOfSubsetProblem,
+    SumOfSubsetSolution,
+)
+
+
+def test_problem_can_be_exported_and_memory_mapped(tmp_path):
+    path = os.path.join(tmp_path, "problem.sosp")
+    SumOfSubsetProblem({"set": [3, -1, 7, 12], "number": 10}).export_to_binary(path)
+
+    problem = SumOfSubsetProblem.from_binary(path)
+
+    assert isinstance(problem.set, np.memmap)
+    assert problem.set.tolist() == [-1, 3, 7, 12]
+    assert problem.number == 10
+
+
+def test_memory_mapped_set_is_its_own_index(tmp_path):
+    path = os.path.join(tmp_path, "problem.sosp")
+    write_binary({"set": list(range(20000, 0, -1)) + [5], "number": 10}, path)
+    problem = SumOfSubsetProblem.from_binary(path)
+
+    assert SumOfSubsetSolution({"subset": [5, 5]}, problem).goal() == 0
+    assert np.shares_memory(problem.index, problem.set)
+
+
+def test_memory_mapped_problem_can_be_solved(tmp_path):
+    path = os.path.join(tmp_path, "problem.sosp")
+    write_binary({"set": list(range(1, 50)), "number": 30}, path)
+    problem = SumOfSubsetProblem.from_binary(path)
+
+    solution = ClimbingSumOfSubsetSolver(problem).solve(limit=1000, size=3)
+
+    assert solution.goal() >= 0
+    assert all(isinstance(number, int) for number in solution.subset)
+
+
+def test_memory_mapped_problem_is_pickled_as_path(tmp_path):
+    path = os.path.join(tmp_path, "problem.sosp")
+    write_binary({"set": list(range(100000)), "number": 5}, path)
+    problem = SumOfSubsetProblem.from_binary(path)
+
+    pickled = pickle.dumps(problem)
+    unpickled = pickle.loads(pickled)
+
+    assert len(pickled) < 1000
+    assert isinstance(unpickled.set, np.memmap)
+    assert unpickled.number == 5
+
+
+def test_json_and_binary_formats_can_be_converted(tmp_path):
+    json_path = os.path.join(tmp_path, "problems.json")
+    problems = [{"set": [1, 2, 3], "number": 3}, {"set": [], "number": 0}]
+    with open(json_path, "w") as output_file:
+        json.dump(problems, output_file)
+
+    paths = json_to_binary(json_path, os.path.join(tmp_path, "problems.sosp"))
+    binary_to_json(paths, os.path.join(tmp_path, "converted.json"))
+
+    with open(os.path.join(tmp_path, "converted.json")) as input_file:
+        assert json.load(input_file) == problems
+
+
+def test_truncated_binary_file_is_rejected(tmp_path):
+    path = os.path.join(tmp_path, "problem.sosp")
+    write_binary({"set": [1, 2, 3], "number": 3}, path)
+    with open(path, "r+b") as binary_file:
+        binary_file.truncate(os.path.getsize(path) - 1)
+
+    with pytest.raises(ValueError):
+        read_binary(path)
@@ -0,0 +1,94 @@
+import os
+
+import numpy as np
+import pytest
+
+from sum_of_subset_problem.binary import read_corpus
+from sum_of_subset_problem.generator import (
+    DISTRIBUTIONS,
+    MAX_HARD_LENGTH,
+    generate_corpus,
+    records_to_dicts,
+    write_binary_corpus,
+    write_jsonl,
+)
+from sum_of_subset_problem.problem import SumOfSubsetProblem, SumOfSubsetSolution
+from sum_of_subset_problem.utilities import generate_problem_with_solution
+
+
+def test_generated_set_has_requested_length():
+    problem_with_solution = generate_problem_with_solution(10, 3)
+
+    assert len(problem_with_solution["problem"]["set"]) == 10
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_corpus_has_planted_solutions(distribution):
+    batches = list(generate_corpus(250, 12, distribution, seed=1, batch_size=100))
+
+    assert [len(records) for records in batches] == [100, 100, 50]
+    for records in batches:
+        for item in records_to_dicts(records):
+            problem = SumOfSubsetProblem(item["problem"])
+            if distribution == "infeasible":
+                assert item["solution"] is None
+                assert all(number % 2 == 0 for number in problem.set)
+                assert problem.number % 2 == 1
+            else:
+                assert SumOfSubsetSolution({"subset": item["solution"]}, problem).is_optimal()
+
+
+def test_corpus_is_reproducible_with_seed():
+    first = np.concatenate(list(generate_corpus(100, 8, "negative", 3, seed=7)))
+    second = np.concatenate(list(generate_corpus(100, 8, "negative", 3, seed=7)))
+
+    assert (first == second).all()
+    assert (first["solution"].sum(axis=1) == 3).all()
+    assert (first["set"] < 0).any()
+
+
+def test_corpus_can_be_streamed_to_files(tmp_path):
+    jsonl_path = os.path.join(tmp_path, "corpus.jsonl")
+    binary_path = os.path.join(tmp_path, "corpus.sosc")
+
+    assert write_jsonl(generate_corpus(30, 5, seed=1, batch_size=7), jsonl_path) == 30
+    assert write_binary_corpus(generate_corpus(30, 5, seed=1, batch_size=7), binary_path, 5) == 30
+
+    with open(jsonl_path) as input_file:
+        assert len(input_file.readlines()) == 30
+    records = read_corpus(binary_path)
+    assert len(records) == 30
+    assert records["set"].shape == (30, 5)
+
+
+def test_corpus_rejects_wrong_params():
+    with pytest.raises(ValueError):
+        list(generate_corpus(10, 5, "gaussian"))
+
+    with pytest.raises(ValueError):
+        list(generate_corpus(10, 5, length_of_subset=6))
+
+    with pytest.raises(ValueError):
+        generate_corpus(10, 5, max_value=0)
+
+    with pytest.raises(ValueError):
+        generate_corpus(-1, 5)
+
+    with pytest.raises(ValueError):
+        generate_corpus(10, MAX_HARD_LENGTH + 1, "hard")
+
+
+def test_arguments_are_checked_before_output_file_is_opened(tmp_path):
+    path = os.path.join(tmp_path, "bad.sosc")
+
+    with pytest.raises(ValueError):
+        write_binary_corpus(generate_corpus(10, 5, "gaussian"), path, 5)
+
+    assert not os.path.exists(path)
+
+
+def test_hard_problems_have_density_close_to_one():
+    records = next(generate_corpus(1000, MAX_HARD_LENGTH, "hard", seed=1))
+
+    assert MAX_HARD_LENGTH / np.log2(records["set"].max()) == pytest.approx(1, abs=0.01)
+    assert (records["number"] >= 0).all()
@@ -0,0 +1,20 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("heavy_module", ["jinja2", "numpy", "matplotlib", "sqlite3"])
+def test_cli_does_not_import_heavy_modules(heavy_module):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, manual; print('{heavy_module}' in sys.modules)"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
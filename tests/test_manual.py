@@ -0,0 +1,59 @@
+import json
+import multiprocessing
+import os
+
+from click.testing import CliRunner
+
+from manual import cli
+from sum_of_subset_problem.problem import SumOfSubsetExperiment
+from sum_of_subset_problem.store import ResultStore
+from sum_of_subset_problem.work_queue import run_worker
+
+
+def write_experiment(tmp_path):
+    path = os.path.join(tmp_path, "experiment.json")
+    with open(path, "w") as experiment_file:
+        json.dump(
+            {
+                "problems": [{"set": [1, 2, 3, 4, 5], "number": 7}],
+                "solvers": [{"solver_name": "bruteforce"}],
+            },
+            experiment_file,
+        )
+    return path
+
+
+def test_run_experiment_saves_runs_to_store(tmp_path):
+    path = write_experiment(tmp_path)
+    store_path = os.path.join(tmp_path, "results.db")
+
+    arguments = ["run-experiment", "--path", path, "--to_file", "", "--store", store_path]
+    result = CliRunner().invoke(cli, arguments)
+    assert result.exit_code == 0, result.output
+    assert len(ResultStore(store_path)) == 1
+
+    # second run is resumed from store, so no run is added
+    result = CliRunner().invoke(cli, arguments)
+    assert result.exit_code == 0, result.output
+    assert len(ResultStore(store_path)) == 1
+
+
+def test_run_distributed_experiment_builds_report(tmp_path):
+    queue = os.path.join(tmp_path, "queue")
+    worker = multiprocessing.Process(target=run_worker, args=(queue, SumOfSubsetExperiment))
+    worker.start()
+
+    arguments = [
+        "run-distributed-experiment",
+        "--path",
+        write_experiment(tmp_path),
+        "--queue",
+        queue,
+        "--to_file",
+        str(tmp_path),
+    ]
+    result = CliRunner().invoke(cli, arguments)
+    worker.join(timeout=30)
+
+    assert result.exit_code == 0, result.output
+    assert os.path.exists(os.path.join(tmp_path, "report.html"))
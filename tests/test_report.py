@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+
+from sum_of_subset_problem.problem import SumOfSubsetExperiment, SumOfSubsetProblem
+from sum_of_subset_problem.report import aggregate_report, bar_chart_svg
+
+
+def prepare_experiment():
+    experiment = SumOfSubsetExperiment()
+    experiment.add_problem(SumOfSubsetProblem({"set": [1, 2, 3, 4, 5], "number": 7}))
+    experiment.add_problem(SumOfSubsetProblem({"set": [2, 4, 6, 8], "number": 10}))
+    experiment.add_solver("bruteforce").add_solver("climbing", {"limit": 100})
+    experiment.run()
+    return experiment
+
+
+def test_report_is_aggregated_into_arrays():
+    experiment = prepare_experiment()
+    aggregated = aggregate_report(experiment.data)
+
+    assert aggregated["time"].shape == (2, 2)
+    assert not np.isnan(aggregated["time"]).any()
+    assert (aggregated["goal"][:, 0] == 0).all()
+
+
+def test_bar_chart_handles_missing_values():
+    svg = bar_chart_svg([1.0, np.nan], ["a", "<b>"], "Title", "Time")
+
+    assert svg.startswith("<svg")
+    assert svg.count("<rect") == 2
+    assert "&lt;b&gt;" in svg
+
+
+def test_html_report_embeds_plots(tmp_path):
+    experiment = prepare_experiment()
+    experiment.build_html_report(tmp_path)
+
+    with open(os.path.join(tmp_path, "report.html")) as report_html:
+        content = report_html.read()
+
+    assert content.count("<svg") == 2 + 3
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".png")]
+
+
+def test_html_report_embeds_convergence_plots(tmp_path):
+    experiment = SumOfSubsetExperiment()
+    experiment.add_problem(SumOfSubsetProblem({"set": list(range(1, 60)), "number": 1000}))
+    experiment.add_solver("climbing", {"limit": 200, "size": 3, "trajectory": 50})
+    experiment.add_solver("sa", {"limit": 200, "size": 3, "trajectory": 50, "trajectory_every": 4})
+    experiment.run()
+    experiment.build_html_report(tmp_path)
+
+    with open(os.path.join(tmp_path, "report.html")) as report_html:
+        content = report_html.read()
+
+    assert content.count("<polyline") == 2
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from sum_of_subset_problem.problem import (
+    ClimbingSumOfSubsetSolver,
+    SimulatedAnnealingSumOfSubsetSolver,
+    SumOfSubsetProblem,
+)
+
+# optimal solution cannot be found, so solvers use the whole limit
+PROBLEM = {"set": list(range(1, 100)), "number": 100000}
+
+
+@pytest.mark.parametrize(
+    "solver_class, restart",
+    [
+        (ClimbingSumOfSubsetSolver, "restart"),
+        (ClimbingSumOfSubsetSolver, "kick"),
+        (SimulatedAnnealingSumOfSubsetSolver, "restart"),
+        (SimulatedAnnealingSumOfSubsetSolver, "kick"),
+        (SimulatedAnnealingSumOfSubsetSolver, "reheat"),
+    ],
+)
+def test_solver_restarts_after_stagnation(solver_class, restart):
+    random.seed(1)
+    solver = solver_class(SumOfSubsetProblem(PROBLEM))
+    solution = solver.solve(limit=2000, size=3, stagnation=50, restart=restart, trajectory=True)
+
+    assert solver.report["restarts"] > 0
+    assert 0 < solver.report["best_attempt"] <= solver.report["attempts"]
+    assert solution is solver.best_solution
+    assert solution.goal() == min(solver.report["trajectory"]["best"])
+
+
+def test_solver_does_not_restart_by_default():
+    solver = ClimbingSumOfSubsetSolver(SumOfSubsetProblem(PROBLEM))
+    solver.solve(limit=500, size=3)
+
+    assert "restarts" not in solver.report
+
+
+def test_climbing_cannot_reheat():
+    solver = ClimbingSumOfSubsetSolver(SumOfSubsetProblem(PROBLEM))
+
+    with pytest.raises(ValueError):
+        solver.solve(limit=500, size=3, stagnation=50, restart="reheat")
@@ -0,0 +1,145 @@
+import asyncio
+import os
+import time
+
+from sum_of_subset_problem.service import SolveService, solve_remote, solve_single
+
+
+def test_single_request_can_be_solved():
+    response = solve_single(
+        {"id": 1, "problem": {"set": [1, 2, 3, 4], "number": 7}, "solver": "bruteforce"}
+    )
+
+    assert response["id"] == 1
+    assert response["goal"] == 0
+    assert sum(response["solution"]) == 7
+    assert response["report"]["attempts"] > 0
+
+
+def test_wrong_request_returns_error():
+    response = solve_single({"id": 2, "problem": {"set": [1, 2]}, "solver": "bruteforce"})
+    assert "error" in response
+
+    response = solve_single({"id": 3, "problem": {"set": [1, 2], "number": 3}, "solver": "magic"})
+    assert "Unknown solver" in response["error"]
+
+
+def test_time_budget_stops_solver():
+    response = solve_single(
+        {
+            "id": 4,
+            "problem": {"set": list(range(1, 100)), "number": 100000},
+            "solver": "climbing",
+            "params": {"size": 5},
+            "time_budget": 0.2,
+        }
+    )
+
+    assert response["report"]["time"] < 1
+    assert response["report"]["attempts"] < 1000000
+
+
+def test_service_solves_batched_requests(tmp_path):
+    socket_path = os.path.join(tmp_path, "service.sock")
+    payloads = [
+        {
+            "id": idx,
+            "problem": {"set": list(range(1, 20)), "number": 10 + idx},
+            "solver": "bruteforce",
+        }
+        for idx in range(50)
+    ]
+    payloads.append({"id": "wrong", "problem": {}, "solver": "bruteforce"})
+
+    async def run():
+        service = SolveService(socket_path, workers=2, batch_size=8, max_pending=4)
+        await service.start()
+        try:
+            return await solve_remote(socket_path, payloads)
+        finally:
+            await service.close()
+
+    responses = asyncio.run(run())
+
+    assert sorted(str(response["id"]) for response in responses) == sorted(
+        str(payload["id"]) for payload in payloads
+    )
+    for response in responses:
+        if response["id"] == "wrong":
+            assert "error" in response
+        else:
+            assert response["goal"] == 0
+
+
+def test_service_answers_requests_in_flight_when_closed(tmp_path):
+    socket_path = os.path.join(tmp_path, "service.sock")
+    payloads = [
+        {
+            "id": idx,
+            "problem": {"set": list(range(1, 100)), "number": 100000},
+            "solver": "climbing",
+            "params": {"size": 5},
+            "time_budget": 0.3,
+        }
+        for idx in range(4)
+    ]
+
+    async def run():
+        service = SolveService(socket_path, workers=1, batch_size=1)
+        await service.start()
+        client = asyncio.create_task(solve_remote(socket_path, payloads))
+        await asyncio.sleep(0.1)
+        await service.close()
+        return await client
+
+    responses = asyncio.run(run())
+
+    assert len(responses) == 4
+    assert any("solution" in response for response in responses)
+    assert any(response.get("error") == "Service is closing" for response in responses)
+
+
+def test_service_closes_idle_connections(tmp_path):
+    socket_path = os.path.join(tmp_path, "service.sock")
+
+    async def run():
+        service = SolveService(socket_path, workers=1)
+        await service.start()
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(service.close(), 5)
+        line = await asyncio.wait_for(reader.readline(), 5)
+        writer.close()
+        return line
+
+    assert asyncio.run(run()) == b""
+
+
+def test_burst_of_requests_is_spread_over_workers(tmp_path):
+    socket_path = os.path.join(tmp_path, "service.sock")
+    payloads = [
+        {
+            "id": idx,
+            "problem": {"set": list(range(1, 100)), "number": 100000},
+            "solver": "climbing",
+            "params": {"size": 5},
+            "time_budget": 0.2,
+        }
+        for idx in range(16)
+    ]
+
+    async def run():
+        service = SolveService(socket_path, workers=4)
+        await service.start()
+        try:
+            start_time = time.time()
+            responses = await solve_remote(socket_path, payloads)
+            return responses, time.time() - start_time
+        finally:
+            await service.close()
+
+    responses, time_taken = asyncio.run(run())
+
+    assert len(responses) == 16
+    # spread over workers it takes 4 rounds of 0.2 s, in single worker it would take 3.2 s
+    assert time_taken < 2.0
@@ -0,0 +1,58 @@
+import os
+
+from sum_of_subset_problem.problem import SumOfSubsetExperiment, SumOfSubsetProblem
+from sum_of_subset_problem.store import ResultStore, hash_problem
+
+
+def prepare_experiment(store):
+    experiment = SumOfSubsetExperiment({"seed": 1}, store=store)
+    experiment.add_problem(SumOfSubsetProblem({"set": [1, 2, 3, 4, 5], "number": 7}))
+    experiment.add_problem(SumOfSubsetProblem({"set": [2, 4, 6, 8], "number": 10}))
+    experiment.add_solver("bruteforce").add_solver("climbing", {"limit": 100})
+    return experiment
+
+
+def test_problem_hash_does_not_depend_on_keys_order():
+    assert hash_problem({"set": [1, 2], "number": 3}) == hash_problem({"number": 3, "set": [1, 2]})
+    assert hash_problem({"set": [1, 2], "number": 3}) != hash_problem({"set": [1, 2], "number": 2})
+
+
+def test_experiment_saves_every_run_to_store(tmp_path):
+    store = ResultStore(os.path.join(tmp_path, "results.db"))
+    experiment = prepare_experiment(store)
+    experiment.run()
+
+    assert len(store) == 4
+    assert [item["solver_name"] for item in store.summary()] == ["bruteforce", "climbing"]
+    assert len(store.runs_for_solver("bruteforce", goal=0)) == 2
+
+
+def test_experiment_resumes_from_store(tmp_path):
+    path = os.path.join(tmp_path, "results.db")
+    experiment = prepare_experiment(ResultStore(path))
+    experiment.run()
+    first_report = experiment.data["report"]
+
+    store = ResultStore(path)
+    resumed_experiment = prepare_experiment(store)
+    resumed_experiment.add_solver("sa", {"limit": 100})
+    resumed_experiment.run()
+
+    assert len(store) == 6
+    for idx_of_problem in first_report:
+        resumed_goals = [item["goal"] for item in resumed_experiment.data["report"][idx_of_problem]]
+        assert len(resumed_goals) == 3
+        for item in first_report[idx_of_problem]:
+            assert item["goal"] in resumed_goals
+
+
+def test_report_can_be_built_from_store(tmp_path):
+    path = os.path.join(tmp_path, "results.db")
+    experiment = prepare_experiment(ResultStore(path))
+    experiment.run()
+
+    rebuilt_experiment = prepare_experiment(ResultStore(path))
+    report = rebuilt_experiment.report_from_store()
+
+    assert sorted(report.keys()) == [0, 1]
+    assert all(len(items) == 2 for items in report.values())
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from sum_of_subset_problem.problem import (
@@ -33,6 +35,16 @@ def test_problem_can_find_close_neighbour(length_of_set, length_of_subset):
     assert close_neighbour.goal() >= 0
 
 
+def test_close_neighbours_follow_multiplicity_of_numbers():
+    random.seed(0)
+    problem = SumOfSubsetProblem({"set": [2, 2, 7, 9], "number": 4})
+    solution = SumOfSubsetSolution({"subset": [2]}, problem)
+    neighbours = [problem.find_close_neighbor(solution) for _ in range(200)]
+
+    assert any(sorted(neighbour["subset"]) == [2, 2] for neighbour in neighbours)
+    assert all(neighbour["subset"].count(2) <= 2 for neighbour in neighbours)
+
+
 def test_solutions_can_be_compared():
     problem = SumOfSubsetProblem({"set": [x for x in range(10)], "number": 15})
     correct_solution = SumOfSubsetSolution({"subset": [6, 9]}, problem)
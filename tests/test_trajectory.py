@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from sum_of_subset_problem.base import Trajectory
+from sum_of_subset_problem.problem import (
+    ClimbingSumOfSubsetSolver,
+    SimulatedAnnealingSumOfSubsetSolver,
+    SumOfSubsetProblem,
+    TabuSumOfSubsetSolver,
+)
+
+PROBLEM = {"set": list(range(1, 200)), "number": 100000}
+
+
+def test_trajectory_keeps_only_latest_items():
+    trajectory = Trajectory(capacity=3, every=2)
+
+    for iteration in range(1, 11):
+        if trajectory.is_due(iteration):
+            trajectory.record(iteration, 10 - iteration, 0)
+
+    exported = trajectory.to_dict()
+    assert len(trajectory) == 3
+    assert exported["iteration"] == [6, 8, 10]
+    assert exported["current"] == [4, 2, 0]
+    assert exported["temperature"] == [None, None, None]
+    assert exported["dropped"] == 2
+
+
+@pytest.mark.parametrize(
+    "solver_class",
+    [ClimbingSumOfSubsetSolver, SimulatedAnnealingSumOfSubsetSolver, TabuSumOfSubsetSolver],
+)
+def test_solver_records_trajectory(solver_class):
+    solver = solver_class(SumOfSubsetProblem(PROBLEM))
+    solver.solve(limit=1000, size=5, trajectory=100, trajectory_every=5)
+
+    trajectory = solver.report["trajectory"]
+    assert len(trajectory["iteration"]) == 100
+    assert trajectory["iteration"][-1] == 1000
+    assert trajectory["dropped"] == 100
+    assert all(best <= current for best, current in zip(trajectory["best"], trajectory["current"]))
+    assert json.dumps(solver.report)
+
+
+def test_solver_does_not_record_trajectory_by_default():
+    solver = ClimbingSumOfSubsetSolver(SumOfSubsetProblem(PROBLEM))
+    solver.solve(limit=100, size=5)
+
+    assert solver.trajectory is None
+    assert "trajectory" not in solver.report
+
+
+@pytest.mark.parametrize(
+    "solver_class",
+    [ClimbingSumOfSubsetSolver, SimulatedAnnealingSumOfSubsetSolver, TabuSumOfSubsetSolver],
+)
+def test_trajectory_ends_with_final_solution(solver_class):
+    solver = solver_class(SumOfSubsetProblem({"set": list(range(1, 30)), "number": 6}))
+    solution = solver.solve(limit=100000, size=3, trajectory=100, trajectory_every=7)
+
+    trajectory = solver.report["trajectory"]
+    assert solution.goal() == 0
+    assert trajectory["iteration"][-1] == solver.report["attempts"]
+    assert trajectory["best"][-1] == 0
+    assert trajectory["current"][-1] == 0
+    assert len(set(trajectory["iteration"])) == len(trajectory["iteration"])
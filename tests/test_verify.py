@@ -0,0 +1,76 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from sum_of_subset_problem.problem import SumOfSubsetProblem, SumOfSubsetSolution
+from sum_of_subset_problem.verify import build_index, check_solution, verify_file, verify_files
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("set_of_numbers", [[1, 2, 2, 5], list(range(20000)) + [2]])
+def test_multiplicity_of_numbers_is_checked(set_of_numbers):
+    index = build_index(set_of_numbers)
+
+    assert check_solution(index, 4, [2, 2]) is None
+    assert check_solution(index, 6, [2, 2, 2]) == "not in set"
+    assert check_solution(index, 5, [2, 2]) == "wrong sum"
+    assert check_solution(index, 0, []) == "empty subset"
+
+
+def test_solution_cannot_reuse_number():
+    problem = SumOfSubsetProblem({"set": [1, 3, 5], "number": 6})
+
+    assert SumOfSubsetSolution({"subset": [1, 5]}, problem).goal() == 0
+    assert SumOfSubsetSolution({"subset": [3, 3]}, problem).goal() == -1
+    assert not SumOfSubsetSolution.check_correctness([1, 3, 5], [3, 3])
+
+
+def test_goal_of_solution_is_evaluated_once(monkeypatch):
+    problem = SumOfSubsetProblem({"set": [1, 3, 5], "number": 6})
+    calls = []
+    contains = problem.contains
+    monkeypatch.setattr(problem, "contains", lambda subset: calls.append(subset) or contains(subset))
+    solution = SumOfSubsetSolution({"subset": [1, 3]}, problem)
+
+    assert solution > SumOfSubsetSolution({"subset": [1]}, problem)
+    assert solution.goal() == solution.goal() == 2
+    assert calls.count([1, 3]) == 1
+
+
+def test_memory_mapped_like_set_uses_sorted_index():
+    index = build_index(np.array([5, 1, 5, 3]))
+
+    assert isinstance(index, np.ndarray)
+    assert check_solution(index, 10, [5, 5]) is None
+
+
+def test_repository_solutions_are_correct():
+    with open(os.path.join(ROOT, "data", "input.json")) as input_file:
+        problems = json.load(input_file)
+    paths = [
+        os.path.join(ROOT, "data", "solutions", f"solution_{idx}.json") for idx in range(3)
+    ]
+
+    summaries, _ = verify_files(paths, problems, workers=2)
+
+    assert sum(summary["correct"] for summary in summaries) == 2
+    assert sum(summary["failures"] for summary in summaries) == 0
+
+
+def test_failures_are_reported(tmp_path):
+    path = os.path.join(tmp_path, "solutions.jsonl")
+    problem = {"set": [1, 2, 3], "number": 5}
+    with open(path, "w") as output_file:
+        for solution in ([2, 3], [1, 1, 3], [1, 2], None, {"subset": [5]}, ["a"]):
+            output_file.write(json.dumps({"problem": problem, "solution": solution}) + "\n")
+
+    summary = verify_file(path)
+
+    assert summary["checked"] == 6
+    assert summary["correct"] == 1
+    assert summary["unsolved"] == 1
+    assert summary["failures"] == 4
+    assert [example["item"] for example in summary["examples"]] == [1, 2, 4, 5]
@@ -0,0 +1,117 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from sum_of_subset_problem.problem import SumOfSubsetExperiment, SumOfSubsetProblem
+from sum_of_subset_problem.work_queue import LeaseHeartbeat, WorkQueue, run_worker
+
+
+def prepare_experiment():
+    experiment = SumOfSubsetExperiment({"seed": 1})
+    for number in range(5, 15):
+        experiment.add_problem(SumOfSubsetProblem({"set": [1, 2, 3, 4, 5, 6], "number": number}))
+    experiment.add_solver("bruteforce").add_solver("climbing", {"limit": 50})
+    return experiment
+
+
+def test_task_can_be_claimed_only_once(tmp_path):
+    work_queue = WorkQueue(str(tmp_path))
+    assert work_queue.submit(prepare_experiment().data) == 20
+
+    claimed = [work_queue.claim("worker") for _ in range(21)]
+
+    assert claimed[-1] is None
+    assert len({task["name"] for task in claimed[:-1]}) == 20
+    assert not work_queue.is_finished()
+
+
+def test_expired_lease_is_requeued(tmp_path):
+    work_queue = WorkQueue(str(tmp_path), lease=0.01)
+    work_queue.submit(prepare_experiment().data)
+    task = work_queue.claim("worker")
+    time.sleep(0.02)
+
+    assert work_queue.requeue_expired() == 1
+    assert work_queue.claim("other worker")["name"] == task["name"]
+
+
+def test_lease_is_renewed_while_task_is_solved(tmp_path):
+    work_queue = WorkQueue(str(tmp_path), lease=0.05)
+    work_queue.submit(prepare_experiment().data)
+    task = work_queue.claim("worker")
+
+    with LeaseHeartbeat(work_queue, task):
+        time.sleep(0.2)
+        assert work_queue.requeue_expired() == 0
+
+    work_queue.complete(task, {})
+    assert not os.listdir(work_queue.claimed)
+
+
+def test_queue_of_other_experiment_is_not_reused(tmp_path):
+    work_queue = WorkQueue(str(tmp_path))
+    experiment = prepare_experiment()
+    work_queue.submit(experiment.data)
+    work_queue.complete(work_queue.claim("worker"), {})
+
+    assert work_queue.submit(experiment.data) == 19
+
+    experiment.add_solver("sa", {"limit": 50})
+    with pytest.raises(ValueError):
+        work_queue.submit(experiment.data)
+
+
+def test_queue_is_finished_when_every_task_has_result(tmp_path):
+    work_queue = WorkQueue(str(tmp_path))
+    work_queue.submit(prepare_experiment().data)
+    tasks = [work_queue.claim("worker") for _ in range(20)]
+    for task in tasks[1:]:
+        work_queue.complete(task, {})
+
+    # only task left is neither pending nor claimed while it is moved back to pending
+    os.unlink(os.path.join(work_queue.claimed, tasks[0]["claimed_name"]))
+    assert not work_queue.is_finished()
+
+    work_queue.complete(tasks[0], {})
+    assert work_queue.is_finished()
+
+
+def test_experiment_is_solved_by_several_workers(tmp_path):
+    path = str(tmp_path)
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(path, SumOfSubsetExperiment, f"w{idx}"))
+        for idx in range(3)
+    ]
+    for process in workers:
+        process.start()
+
+    experiment = prepare_experiment()
+    experiment.run_distributed(path, poll=0.05)
+
+    for process in workers:
+        process.join(timeout=30)
+        assert process.exitcode == 0
+
+    assert sorted(experiment.data["report"].keys()) == list(range(10))
+    for items in experiment.data["report"].values():
+        assert sorted(item["solver_id"] for item in items) == [0, 1]
+    assert len(os.listdir(os.path.join(path, "results"))) == 20
+
+
+def test_failing_tasks_are_reported(tmp_path):
+    path = str(tmp_path)
+    worker = multiprocessing.Process(target=run_worker, args=(path, SumOfSubsetExperiment, "w"))
+    worker.start()
+
+    experiment = prepare_experiment()
+    experiment.add_solver("climbing", {"limit": 50, "stagnation": 5, "restart": "bogus"})
+    failed = experiment.run_distributed(path, poll=0.05)
+    worker.join(timeout=30)
+
+    assert worker.exitcode == 0
+    assert len(failed) == 10
+    assert all("Unknown restart" in item["error"] for item in failed)
+    for items in experiment.data["report"].values():
+        assert sorted(item["solver_id"] for item in items) == [0, 1]